@@ -287,6 +287,7 @@ class BotConfig:
     control_redeploy_command: str = ""
     control_redeploy_timeout_seconds: int = 900
     enable_metadata_logging: bool = True
+    report_async_writes: bool = False
 
     enable_quarterly_goal_tracking: bool = True
     quarterly_goal_label: str = "Q1 2026 Survival and Learn"
@@ -556,6 +557,7 @@ class BotConfig:
             control_redeploy_command=os.getenv("CONTROL_REDEPLOY_COMMAND", "").strip(),
             control_redeploy_timeout_seconds=max(30, _env_int("CONTROL_REDEPLOY_TIMEOUT_SECONDS", 900)),
             enable_metadata_logging=_env_bool("ENABLE_METADATA_LOGGING", True),
+            report_async_writes=_env_bool("REPORT_ASYNC_WRITES", False),
             enable_quarterly_goal_tracking=_env_bool("ENABLE_QUARTERLY_GOAL_TRACKING", True),
             quarterly_goal_label=os.getenv("QUARTERLY_GOAL_LABEL", "Q1 2026 Survival and Learn").strip()
             or "Q1 2026 Survival and Learn",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
+from functools import lru_cache
 
 
 def _nth_weekday(year: int, month: int, weekday: int, occurrence: int) -> date:
@@ -50,7 +51,10 @@ def _easter_sunday(year: int) -> date:
 def us_equity_market_holidays(year: int) -> set[date]:
     holidays: set[date] = set()
 
-    holidays.add(_observed_fixed_holiday(year, 1, 1))  # New Year's Day
+    new_years_day = date(year, 1, 1)
+    # NYSE does not close the prior Friday when New Year's Day falls on a Saturday.
+    if new_years_day.weekday() != 5:
+        holidays.add(_observed_fixed_holiday(year, 1, 1))  # New Year's Day
     holidays.add(_nth_weekday(year, 1, 0, 3))  # MLK Day
     holidays.add(_nth_weekday(year, 2, 0, 3))  # Presidents' Day
 
@@ -67,12 +71,12 @@ def us_equity_market_holidays(year: int) -> set[date]:
     return holidays
 
 
+@lru_cache(maxsize=16)
+def _holidays_for(year: int) -> frozenset[date]:
+    return frozenset(us_equity_market_holidays(year))
+
+
 def is_us_equity_market_day(day: date) -> bool:
     if day.weekday() >= 5:
         return False
-
-    holidays = set()
-    for year in (day.year - 1, day.year, day.year + 1):
-        holidays.update(us_equity_market_holidays(year))
-
-    return day not in holidays
+    return day not in _holidays_for(day.year)
@@ -116,13 +116,17 @@ def fetch_google_news_items(
     return items
 
 
+_WORD_PATTERN = re.compile(r"[a-zA-Z']+")
+
+
 def _headline_score(headline: str) -> float:
-    words = re.findall(r"[a-zA-Z']+", headline.lower())
+    words = _WORD_PATTERN.findall(headline.lower())
     if not words:
         return 0.0
 
-    positive = sum(1 for token in words if token in POSITIVE_WORDS)
-    negative = sum(1 for token in words if token in NEGATIVE_WORDS)
+    # map() over the set's __contains__ keeps the per-token membership test in C.
+    positive = sum(map(POSITIVE_WORDS.__contains__, words))
+    negative = sum(map(NEGATIVE_WORDS.__contains__, words))
 
     if positive == 0 and negative == 0:
         return 0.0
@@ -3,9 +3,13 @@ from __future__ import annotations
 import json
 import logging
 import re
+import threading
 import xml.etree.ElementTree as ET
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from functools import partial
 from html import unescape
 from urllib.parse import quote_plus, urlparse
 from urllib.request import Request, urlopen
@@ -13,6 +17,12 @@ from urllib.request import Request, urlopen
 from .news import NewsItem, fetch_google_news_items
 
 _SEC_TICKER_MAP: dict[str, str] | None = None
+_SEC_TICKER_MAP_LOCK = threading.Lock()
+
+# One pool shared by every collect_research_items call, so concurrent symbols
+# cannot multiply the number of fetch threads.
+RESEARCH_FETCH_WORKERS = 5
+_FETCH_POOL = ThreadPoolExecutor(max_workers=RESEARCH_FETCH_WORKERS, thread_name_prefix="research-fetch")
 
 
 def _to_utc(dt: datetime) -> datetime:
@@ -138,7 +148,13 @@ def _load_sec_ticker_map(*, timeout_seconds: float, user_agent: str) -> dict[str
     global _SEC_TICKER_MAP
     if _SEC_TICKER_MAP is not None:
         return _SEC_TICKER_MAP
+    with _SEC_TICKER_MAP_LOCK:
+        if _SEC_TICKER_MAP is None:
+            _SEC_TICKER_MAP = _fetch_sec_ticker_map(timeout_seconds=timeout_seconds, user_agent=user_agent)
+        return _SEC_TICKER_MAP
+
 
+def _fetch_sec_ticker_map(*, timeout_seconds: float, user_agent: str) -> dict[str, str]:
     payload = _fetch_url_json(
         "https://www.sec.gov/files/company_tickers.json",
         timeout_seconds=timeout_seconds,
@@ -158,7 +174,6 @@ def _load_sec_ticker_map(*, timeout_seconds: float, user_agent: str) -> dict[str
             if digits:
                 mapping[ticker] = digits.zfill(10)
 
-    _SEC_TICKER_MAP = mapping
     return mapping
 
 
@@ -552,6 +567,14 @@ def _dedupe_items(items: list[NewsItem]) -> list[NewsItem]:
     return deduped
 
 
+def _fetch_source(symbol: str, label: str, fetch: Callable[[], list[NewsItem]]) -> list[NewsItem]:
+    try:
+        return fetch()
+    except Exception as exc:
+        logging.warning("%s failed for %s: %s", label, symbol, exc)
+        return []
+
+
 def collect_research_items(
     symbol: str,
     query: str,
@@ -578,31 +601,28 @@ def collect_research_items(
     enable_analyst_ratings: bool,
     finnhub_api_key: str,
 ) -> list[NewsItem]:
-    items: list[NewsItem] = []
-
-    try:
+    def fetch_news() -> list[NewsItem]:
         news_items = fetch_google_news_items(
             query,
             lookback_hours=max(1, news_lookback_hours),
             max_items=max(1, max_items_per_source),
             timeout_seconds=timeout_seconds,
         )
-    except Exception as exc:
-        logging.warning("News lookup failed for %s: %s", symbol, exc)
-        news_items = []
-
-    if include_full_article_text and news_items:
-        news_items = enrich_with_full_text(
-            news_items,
-            timeout_seconds=timeout_seconds,
-            max_chars=max(200, article_text_max_chars),
-        )
-    items.extend(news_items)
+        if include_full_article_text and news_items:
+            news_items = enrich_with_full_text(
+                news_items,
+                timeout_seconds=timeout_seconds,
+                max_chars=max(200, article_text_max_chars),
+            )
+        return news_items
 
+    sources: list[tuple[str, Callable[[], list[NewsItem]]]] = [("News lookup", fetch_news)]
     if enable_sec_filings:
-        try:
-            items.extend(
-                fetch_sec_filings_items(
+        sources.append(
+            (
+                "SEC filings fetch",
+                partial(
+                    fetch_sec_filings_items,
                     symbol,
                     lookback_hours=max(1, sec_lookback_hours),
                     max_items=max(1, max_items_per_source),
@@ -611,30 +631,30 @@ def collect_research_items(
                     forms=sec_forms,
                     include_full_text=include_full_article_text,
                     max_content_chars=max(200, article_text_max_chars),
-                )
+                ),
             )
-        except Exception as exc:
-            logging.warning("SEC filings fetch failed for %s: %s", symbol, exc)
-
+        )
     if enable_earnings_transcripts:
-        try:
-            items.extend(
-                fetch_earnings_transcript_items(
+        sources.append(
+            (
+                "Earnings transcript fetch",
+                partial(
+                    fetch_earnings_transcript_items,
                     symbol,
                     lookback_hours=max(1, earnings_lookback_hours),
                     max_items=max(1, max_items_per_source),
                     timeout_seconds=timeout_seconds,
                     fmp_api_key=fmp_api_key,
                     max_content_chars=max(200, earnings_transcript_max_chars),
-                )
+                ),
             )
-        except Exception as exc:
-            logging.warning("Earnings transcript fetch failed for %s: %s", symbol, exc)
-
+        )
     if enable_social_feeds:
-        try:
-            items.extend(
-                fetch_social_feed_items(
+        sources.append(
+            (
+                "Social feed fetch",
+                partial(
+                    fetch_social_feed_items,
                     symbol,
                     query,
                     rss_urls=social_feed_rss_urls,
@@ -642,26 +662,35 @@ def collect_research_items(
                     lookback_hours=max(1, social_lookback_hours),
                     max_items=max(1, max_items_per_source),
                     timeout_seconds=timeout_seconds,
-                )
+                ),
             )
-        except Exception as exc:
-            logging.warning("Social feed fetch failed for %s: %s", symbol, exc)
-
+        )
     if enable_analyst_ratings:
-        try:
-            items.extend(
-                fetch_analyst_rating_items(
+        sources.append(
+            (
+                "Analyst rating fetch",
+                partial(
+                    fetch_analyst_rating_items,
                     symbol,
                     lookback_hours=max(1, analyst_lookback_hours),
                     max_items=max(1, max_items_per_source),
                     timeout_seconds=timeout_seconds,
                     finnhub_api_key=finnhub_api_key,
                     fmp_api_key=fmp_api_key,
-                )
+                ),
             )
-        except Exception as exc:
-            logging.warning("Analyst rating fetch failed for %s: %s", symbol, exc)
+        )
+
+    # Each source is an independent set of HTTP round trips, so fetch them
+    # concurrently. Batches are merged in source order so dedupe and the
+    # stable sort below keep the same item as a serial fetch would.
+    if len(sources) == 1:
+        batches = [_fetch_source(symbol, *sources[0])]
+    else:
+        futures = [_FETCH_POOL.submit(_fetch_source, symbol, label, fetch) for label, fetch in sources]
+        batches = [future.result() for future in futures]
 
+    items = [item for batch in batches for item in batch]
     items = _dedupe_items(items)
     epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
     items.sort(key=lambda item: item.published_at or epoch, reverse=True)
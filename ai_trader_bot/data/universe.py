@@ -74,19 +74,18 @@ QUANTUM_QUERIES: dict[str, str] = {
 }
 
 
-def build_theme_map(symbols: list[str], include_quantum: bool) -> dict[str, str]:
-    theme_map = dict(AI_THEME_QUERIES)
-    if include_quantum:
-        theme_map.update(QUANTUM_QUERIES)
+_FALLBACK_THEME_QUERY = "{symbol} AI compute infrastructure software platform data center raw materials space"
+
 
+def build_theme_map(symbols: list[str], include_quantum: bool) -> dict[str, str]:
     resolved: dict[str, str] = {}
     for symbol in symbols:
         clean = symbol.strip().upper()
         if not clean:
             continue
-        resolved[clean] = theme_map.get(
-            clean,
-            f"{clean} AI compute infrastructure software platform data center raw materials space",
-        )
+        query = AI_THEME_QUERIES.get(clean)
+        if query is None and include_quantum:
+            query = QUANTUM_QUERIES.get(clean)
+        resolved[clean] = query if query is not None else _FALLBACK_THEME_QUERY.format(symbol=clean)
 
     return resolved
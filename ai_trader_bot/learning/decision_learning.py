@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import os
 import uuid
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -29,11 +31,23 @@ DEFAULT_SOURCE_TYPES = [
     "unknown",
 ]
 
+_FAILURE_TAG_DRIVERS: tuple[tuple[frozenset[str], str], ...] = (
+    (frozenset({"news_score"}), "news_overreaction"),
+    (frozenset({"momentum_20d", "momentum_5d"}), "momentum_reversal"),
+    (frozenset({"ai_short_term", "ai_long_term"}), "ai_thesis_miss"),
+    (frozenset({"macro_score"}), "macro_policy_miss"),
+)
+
 
 def _clamp(value: float, low: float, high: float) -> float:
     return max(low, min(high, value))
 
 
+@functools.lru_cache(maxsize=1024)
+def _normalize_source_key(source_type: str) -> str:
+    return source_type.strip().lower() or "unknown"
+
+
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -57,6 +71,25 @@ def signal_feature_profile(
     }
 
 
+def _feature_vector(feature_profile: Any) -> tuple[float, ...]:
+    """Pack a feature profile into a tuple ordered like FEATURE_KEYS.
+
+    Accepts the dict form produced by signal_feature_profile as well as the
+    list form a tuple round-trips to through the JSON state file.
+    """
+    if isinstance(feature_profile, dict):
+        raw_values = [feature_profile.get(key) for key in FEATURE_KEYS]
+    elif isinstance(feature_profile, (list, tuple)) and len(feature_profile) == len(FEATURE_KEYS):
+        raw_values = list(feature_profile)
+    else:
+        return (0.0,) * len(FEATURE_KEYS)
+    return tuple(float(value) if isinstance(value, (int, float)) else 0.0 for value in raw_values)
+
+
+def _feature_dict(feature_vector: tuple[float, ...]) -> dict[str, float]:
+    return dict(zip(FEATURE_KEYS, feature_vector))
+
+
 def call_rationale(feature_profile: dict[str, float], *, max_items: int = 3) -> list[dict[str, float | str]]:
     ranked: list[tuple[str, float]] = []
     for key, value in feature_profile.items():
@@ -78,14 +111,9 @@ def failure_tags(feature_profile: dict[str, float], realized_return: float) -> l
     top = call_rationale(feature_profile, max_items=2)
     drivers = {str(item["driver"]) for item in top}
 
-    if "news_score" in drivers:
-        tags.append("news_overreaction")
-    if "momentum_20d" in drivers or "momentum_5d" in drivers:
-        tags.append("momentum_reversal")
-    if "ai_short_term" in drivers or "ai_long_term" in drivers:
-        tags.append("ai_thesis_miss")
-    if "macro_score" in drivers:
-        tags.append("macro_policy_miss")
+    for driver_set, tag in _FAILURE_TAG_DRIVERS:
+        if not driver_set.isdisjoint(drivers):
+            tags.append(tag)
 
     volatility = float(feature_profile.get("volatility_risk", 0.0))
     if volatility > 0.09:
@@ -129,6 +157,7 @@ class DecisionLearningStore:
         self.source_bias: dict[str, float] = {key: 0.0 for key in DEFAULT_SOURCE_TYPES}
         self.open_calls: dict[str, dict[str, Any]] = {}
         self.market_observations: dict[str, dict[str, Any]] = {}
+        self._last_saved_state: str | None = None
 
         self._load()
 
@@ -186,12 +215,22 @@ class DecisionLearningStore:
             "source_learning_enabled": self.enable_source_priority_learning,
             "open_calls": self.open_calls,
             "market_observations": self.market_observations,
-            "updated_at": _now_utc().isoformat(),
         }
         try:
+            # Skip the rewrite when nothing but the timestamp would change, so
+            # updated_at records the last state change rather than the last save.
+            state_text = json.dumps(payload, indent=2)
+            if state_text == self._last_saved_state and self.state_path.exists():
+                return
+
             if self.state_path.parent != Path("."):
                 self.state_path.parent.mkdir(parents=True, exist_ok=True)
-            self.state_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+            # Same bytes as dumping the payload with updated_at as its last key, without a second dumps.
+            stamped = f'{state_text[:-2]},\n  "updated_at": {json.dumps(_now_utc().isoformat())}\n}}'
+            tmp_path.write_text(stamped, encoding="utf-8")
+            os.replace(tmp_path, self.state_path)
+            self._last_saved_state = state_text
         except Exception as exc:
             logging.warning("Failed writing learning state %s: %s", self.state_path, exc)
 
@@ -216,15 +255,15 @@ class DecisionLearningStore:
         return adjustment
 
     def source_multiplier_for(self, source_type: str) -> float:
-        key = source_type.strip().lower() or "unknown"
+        key = _normalize_source_key(source_type)
         bias = float(self.source_bias.get(key, 0.0))
         # Bias maps to a magnitude multiplier for source sentiment.
-        return _clamp(1.0 + bias, 0.25, 2.0)
+        return max(0.25, min(2.0, 1.0 + bias))
 
     def source_multipliers_for(self, source_types: list[str]) -> dict[str, float]:
         result: dict[str, float] = {}
         for source_type in source_types:
-            key = source_type.strip().lower() or "unknown"
+            key = _normalize_source_key(source_type)
             result[key] = self.source_multiplier_for(key)
         return result
 
@@ -239,7 +278,7 @@ class DecisionLearningStore:
         for raw_key, raw_row in source_profile.items():
             if not isinstance(raw_key, str) or not isinstance(raw_row, dict):
                 continue
-            key = raw_key.strip().lower() or "unknown"
+            key = _normalize_source_key(raw_key)
 
             sentiment_raw = raw_row.get("sentiment")
             count_raw = raw_row.get("count")
@@ -277,9 +316,10 @@ class DecisionLearningStore:
         if total_count <= 0:
             return {}
 
+        max_bias = self.max_source_bias
         changed: dict[str, float] = {}
         for source_type, row in source_profile.items():
-            sentiment = _clamp(float(row.get("sentiment", 0.0)), -1.0, 1.0)
+            sentiment = max(-1.0, min(1.0, float(row.get("sentiment", 0.0))))
             count = max(0.0, float(row.get("count", 0.0)))
             if count <= 0 or sentiment == 0:
                 continue
@@ -297,7 +337,7 @@ class DecisionLearningStore:
                 continue
 
             before = float(self.source_bias.get(source_type, 0.0))
-            after = _clamp(before + delta, -self.max_source_bias, self.max_source_bias)
+            after = max(-max_bias, min(max_bias, before + delta))
             if after != before:
                 self.source_bias[source_type] = after
                 changed[source_type] = after - before
@@ -384,7 +424,7 @@ class DecisionLearningStore:
             "created_at": created_at.isoformat(),
             "entry_price": signal.price,
             "signal_score": signal.score,
-            "feature_profile": feature_profile,
+            "feature_profile": _feature_vector(feature_profile),
             "source_profile": normalized_source_profile,
             "rationale": reason,
             "kind": "options_focus" if signal.score >= option_threshold else "equity_focus",
@@ -443,7 +483,8 @@ class DecisionLearningStore:
             return None
 
         realized_return = (current_price / float(entry_price)) - 1.0
-        feature_profile = call.get("feature_profile") if isinstance(call.get("feature_profile"), dict) else {}
+        feature_vector = _feature_vector(call.get("feature_profile"))
+        feature_profile = _feature_dict(feature_vector)
         source_profile = self._normalize_source_profile(
             call.get("source_profile") if isinstance(call.get("source_profile"), dict) else {}
         )
@@ -454,7 +495,7 @@ class DecisionLearningStore:
         elif realized_return >= self.good_call_return_threshold:
             outcome = "good_call"
 
-        update_summary = self._update_penalties(feature_profile, realized_return, outcome)
+        update_summary = self._update_penalties(feature_vector, realized_return, outcome)
         source_update_summary = self._update_source_bias(
             source_profile,
             realized_return=realized_return,
@@ -490,36 +531,30 @@ class DecisionLearningStore:
 
     def _update_penalties(
         self,
-        feature_profile: dict[str, Any],
+        feature_vector: tuple[float, ...],
         realized_return: float,
         outcome: str,
     ) -> dict[str, float]:
-        changed: dict[str, float] = {}
-        magnitude = min(abs(realized_return) / 0.05, 2.0)
+        if outcome == "bad_call":
+            step = self.learning_rate
+        elif outcome == "good_call":
+            step = -0.5 * self.learning_rate
+        else:
+            return {}
+        # Moves inside the noise floor say nothing about the features behind the call.
+        if abs(realized_return) < 1e-4:
+            return {}
 
-        for key in FEATURE_KEYS:
-            raw_value = feature_profile.get(key)
-            value = float(raw_value) if isinstance(raw_value, (int, float)) else 0.0
-            exposure = max(0.0, value)
-            if exposure == 0:
+        step *= min(abs(realized_return) / 0.05, 2.0)
+
+        max_penalty = self.max_feature_penalty
+        changed: dict[str, float] = {}
+        for key, value in zip(FEATURE_KEYS, feature_vector):
+            if value <= 0:
                 continue
 
             before = self.feature_penalties.get(key, 0.0)
-            after = before
-
-            if outcome == "bad_call":
-                after = _clamp(
-                    before + (self.learning_rate * magnitude * exposure),
-                    0.0,
-                    self.max_feature_penalty,
-                )
-            elif outcome == "good_call":
-                after = _clamp(
-                    before - (0.5 * self.learning_rate * magnitude * exposure),
-                    0.0,
-                    self.max_feature_penalty,
-                )
-
+            after = max(0.0, min(max_penalty, before + (step * value)))
             if after != before:
                 self.feature_penalties[key] = after
                 changed[key] = after - before
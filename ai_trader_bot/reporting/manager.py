@@ -1,15 +1,32 @@
 from __future__ import annotations
 
+import contextlib
+import functools
 import json
 import hashlib
+import heapq
+import itertools
 import logging
-from collections import defaultdict
-from dataclasses import dataclass
-from datetime import date, datetime, timedelta, timezone
+import math
+import os
+import re
+import sys
+import threading
+import weakref
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..core.config import BotConfig
 from ..data.market_calendar import is_us_equity_market_day
 from ..strategy.options import option_underlying
@@ -24,6 +41,584 @@ WEEKDAY_INDEX = {
     "SUN": 6,
 }
 
+EVENT_BOOTSTRAP_OPTIMIZATION = "bootstrap_optimization_report"
+EVENT_QUARTERLY_ADVISOR = "quarterly_model_advisor"
+EVENT_MODEL_ROADMAP = "model_roadmap_advisor"
+EVENT_DAILY_REPORT = "daily_report"
+EVENT_WEEKLY_REPORT = "weekly_report"
+EVENT_CALL_RESOLVED = "decision_call_resolved"
+
+# Pending (path, encoded lines) batches held by the background log writer.
+WRITE_QUEUE_MAXSIZE = 1024
+
+# Seconds an append waits for room in a full write queue before writing synchronously.
+WRITE_QUEUE_PUT_TIMEOUT = 5.0
+
+# Appended log bytes are read and parsed in blocks of this size.
+JSONL_READ_BLOCK_SIZE = 1 << 20
+
+# Research items are deduplicated against a rolling window of the most recent ids.
+RESEARCH_DEDUPE_WINDOW = 20000
+
+_ITEM_ID_RE = re.compile(rb'"item_id"\s*:\s*"([0-9a-f]+)"')
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """Decode one JSON document from str or bytes, preferring orjson when installed.
+
+    Older logs were written by ``json.dumps``, which emits bare ``NaN``/``Infinity``;
+    orjson rejects those, so a failed orjson decode is retried with ``json``.
+    Both raise ``ValueError`` subclasses on malformed input.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _text(value: Any) -> str:
+    """Stripped string form of a loosely-typed log field (``None`` -> ``""``)."""
+    if isinstance(value, str):
+        return value.strip()
+    return str(value or "").strip()
+
+
+def _num(value: Any, default: float = 0.0) -> float:
+    """Return a logged number as-is, coercing anything else like ``float(value or default)``."""
+    if type(value) is float or type(value) is int:
+        return value or default
+    return float(value or default)
+
+
+def _count(value: Any) -> int:
+    """Return a logged integer as-is, coercing anything else like ``int(value or 0)``."""
+    if type(value) is int:
+        return value
+    return int(value or 0)
+
+
+def _optional_float(value: Any) -> float | None:
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+def _dict_field(source: dict[str, Any], key: str) -> dict[str, Any]:
+    value = source.get(key)
+    return value if isinstance(value, dict) else {}
+
+
+def _research_digest(symbol: str, source_type: str, title: str, link: str, published_at: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (symbol, source_type, title, link, published_at):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"|")
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=128)
+def _quarter_start_for(day: date) -> date:
+    month = ((day.month - 1) // 3) * 3 + 1
+    return date(day.year, month, 1)
+
+
+@functools.lru_cache(maxsize=128)
+def _next_quarter_start(day: date) -> date:
+    start = _quarter_start_for(day)
+    month = start.month + 3
+    year = start.year
+    if month > 12:
+        month = 1
+        year += 1
+    return date(year, month, 1)
+
+
+@functools.lru_cache(maxsize=128)
+def _quarter_index(day: date) -> int:
+    return ((day.month - 1) // 3) + 1
+
+
+@functools.lru_cache(maxsize=8)
+def _goal_window(start_text: str, end_text: str) -> tuple[date, date] | None:
+    try:
+        return date.fromisoformat(start_text), date.fromisoformat(end_text)
+    except ValueError:
+        return None
+
+
+def _date_range(start: date, days: int) -> Iterator[date]:
+    for offset in range(days):
+        yield start + timedelta(days=offset)
+
+
+def _equity_stats(
+    equity: list[float],
+    *,
+    missing_as_first: bool = False,
+) -> tuple[float, float, float, float, float]:
+    """Return ``(first, last, peak, trough, max_drawdown)`` of an equity series in one pass.
+
+    ``max_drawdown`` is the largest fall from a running peak as a fraction of
+    that peak. With ``missing_as_first``, zero (missing) equity values count
+    as the first equity when computing the trough.
+    """
+    if not equity:
+        return 0.0, 0.0, 0.0, 0.0, 0.0
+    first = last = peak = trough = equity[0]
+    max_drawdown = 0.0
+    for value in itertools.islice(equity, 1, None):
+        last = value
+        if value > peak:
+            peak = value
+        elif peak > 0:
+            drawdown = (peak - value) / peak
+            if drawdown > max_drawdown:
+                max_drawdown = drawdown
+        if missing_as_first and not value:
+            value = first
+        if value < trough:
+            trough = value
+    return first, last, peak, trough, max_drawdown
+
+
+# Model-strength knobs reviewed by the quarterly advisor: (key, label) in report order.
+_STRENGTH_LABELS = (
+    ("historical_research_weight", "Historical Research Weight"),
+    ("historical_research_feedback_strength", "Historical Pattern Feedback Strength"),
+    ("decision_learning_rate", "Decision Learning Rate"),
+    ("source_priority_learning_rate", "Source Priority Learning Rate"),
+    ("macro_model_weight", "Macro Model Weight"),
+    ("ai_feedback_strength", "AI Feedback Strength"),
+)
+
+# Allowed (low, high) range for each recommended knob value.
+_STRENGTH_BOUNDS = {
+    "historical_research_weight": (0.15, 0.40),
+    "historical_research_feedback_strength": (0.08, 0.20),
+    "decision_learning_rate": (0.04, 0.18),
+    "source_priority_learning_rate": (0.05, 0.20),
+    "macro_model_weight": (0.05, 0.20),
+    "ai_feedback_strength": (0.04, 0.20),
+}
+
+# Quarter-regime adjustments: (knob, delta, reason), applied in order.
+_RISK_STRESS_RULES = (
+    (
+        "historical_research_weight",
+        -0.03,
+        "Reduced to keep recent 7-day information more dominant during drawdown/high error periods.",
+    ),
+    (
+        "historical_research_feedback_strength",
+        -0.02,
+        "Reduced to avoid overreacting to noisy short-term reversals.",
+    ),
+    (
+        "decision_learning_rate",
+        -0.02,
+        "Reduced to slow cross-ticker penalty shifts while the regime is unstable.",
+    ),
+    (
+        "source_priority_learning_rate",
+        -0.02,
+        "Reduced to prevent rapid source-weight swings under stressed conditions.",
+    ),
+    (
+        "macro_model_weight",
+        -0.02,
+        "Reduced to limit macro-overrides when core signal quality is mixed.",
+    ),
+    (
+        "ai_feedback_strength",
+        0.01,
+        "Slightly increased so AI thesis memory adapts faster after wrong-way moves.",
+    ),
+)
+_STRONG_QUARTER_RULES = (
+    (
+        "historical_research_weight",
+        0.02,
+        "Increased slightly to preserve useful historical context from a stable quarter.",
+    ),
+    (
+        "historical_research_feedback_strength",
+        0.02,
+        "Increased to learn event-impact patterns a bit faster while outcomes are reliable.",
+    ),
+    (
+        "decision_learning_rate",
+        0.01,
+        "Increased slightly so cross-ticker lessons are applied faster.",
+    ),
+    (
+        "source_priority_learning_rate",
+        0.01,
+        "Increased slightly to reinforce reliable source types.",
+    ),
+    (
+        "macro_model_weight",
+        0.01,
+        "Increased modestly since macro integration behaved well this quarter.",
+    ),
+)
+_LOW_ACTIVITY_RULES = (
+    (
+        "macro_model_weight",
+        0.01,
+        "Increased slightly to help break ties when too many trade-capable cycles produce no action.",
+    ),
+    (
+        "decision_learning_rate",
+        0.01,
+        "Increased slightly to speed adaptation in a low-activity quarter.",
+    ),
+)
+_HIGH_ERROR_RULES = (
+    (
+        "historical_research_feedback_strength",
+        -0.01,
+        "Reduced slightly to avoid overfitting pattern feedback in mixed conditions.",
+    ),
+    (
+        "source_priority_learning_rate",
+        -0.01,
+        "Reduced slightly until source-quality alignment improves.",
+    ),
+)
+
+
+# Fixed sections of the quarterly model advisor body, filled with str.format_map.
+_QUARTERLY_ADVISOR_SUMMARY = (
+    "Quarterly model-strength recommendation for next quarter start {next_quarter_start}.\n"
+    "Evaluation window: {evaluation_start} through {evaluation_end} (report timezone).\n"
+    "\n"
+    "Quarter performance summary:\n"
+    "- Equity: ${start_equity:,.2f} -> ${end_equity:,.2f} ({return_pct:+.2f}%)\n"
+    "- Max drawdown observed: {drawdown_pct:.2f}%\n"
+    "- Decisions logged: {decisions_logged}\n"
+    "- Resolved calls: {resolved_calls} (good={good_calls}, bad={bad_calls}{bad_rate_text})"
+)
+_QUARTERLY_ADVISOR_COMPARISON = (
+    "Results vs previous quarterly review:\n"
+    "- Return delta: {quarter_return_pct_delta:+.4f}, "
+    "drawdown delta: {max_drawdown_pct_delta:+.4f}, "
+    "bad-call delta: {bad_call_rate_delta:+.4f}, "
+    "no-trade delta: {no_trade_ratio_delta:+.4f}"
+)
+
+# Fixed sections of the model roadmap advisor body, filled with str.format_map.
+_MODEL_ROADMAP_SUMMARY = (
+    "Model roadmap recommendation for next quarter start {next_quarter_start}.\n"
+    "This advisor runs for Q1/Q3 and is sent {reminder_days} days before quarter start.\n"
+    "Evaluation window: {evaluation_start} through {evaluation_end} (report timezone).\n"
+    "\n"
+    "Learning summary from this quarter:\n"
+    "- Equity: ${start_equity:,.2f} -> ${end_equity:,.2f} ({return_pct:+.2f}%)\n"
+    "- Max drawdown: {drawdown_pct:.2f}%\n"
+    "- Decisions logged: {decisions_logged}\n"
+    "- Resolved calls: {resolved_calls}{bad_rate_text}"
+)
+_MODEL_ROADMAP_COMPARISON = (
+    "Results vs previous roadmap review:\n"
+    "- Return delta: {quarter_return_pct_delta:+.4f}, "
+    "drawdown delta: {max_drawdown_pct_delta:+.4f}, "
+    "source concentration delta: {source_concentration_delta:+.4f}, "
+    "top-priority score delta: {top_priority_score_delta:+.4f}"
+)
+
+
+# Candidate new models for the roadmap advisor, in tie-break order.
+_MODEL_IDEAS: dict[str, dict[str, str]] = {
+    "regime_risk_model": {
+        "label": "Regime Risk Model",
+        "effort": "Medium",
+        "estimate": "2-3 weeks",
+        "build": (
+            "Build a market-regime classifier (risk-on/risk-off/high-vol) that gates position sizing "
+            "and reduces entries during unstable regimes."
+        ),
+    },
+    "event_impact_horizon_model": {
+        "label": "Event Impact Horizon Model",
+        "effort": "High",
+        "estimate": "3-5 weeks",
+        "build": (
+            "Build an event-impact model that maps filing/news/policy event types to expected "
+            "price impact direction and time horizon."
+        ),
+    },
+    "source_reliability_forecaster": {
+        "label": "Source Reliability Forecaster",
+        "effort": "Medium",
+        "estimate": "2-4 weeks",
+        "build": (
+            "Build a source-quality forecaster that predicts which source types are likely to be "
+            "reliable by regime and ticker cluster."
+        ),
+    },
+    "opportunity_ranking_model": {
+        "label": "Opportunity Ranking Model",
+        "effort": "Low",
+        "estimate": "1-2 weeks",
+        "build": (
+            "Build an opportunity-ranking model that improves trade selection when many names are close "
+            "in score, reducing no-trade cycles."
+        ),
+    },
+}
+
+
+# Bound str.format templates for advisor lines rendered once per row.
+_NO_ORDER_CYCLES_LINE = "- Trade-capable cycles with no orders: {}/{} ({:.1f}%)".format
+_NO_ORDER_RATIO_LINE = "- Trade-capable no-order ratio: {}/{} ({:.1f}%)".format
+_SOURCE_CONCENTRATION_LINE = "- Source concentration: {:.1f}% from top source type across {} research items.".format
+_STRENGTH_ROW_LINE = "- [{}] {}: {:.3f} -> {:.3f}. {}".format
+_MODEL_IDEA_LINES = "- {} (priority {:.2f}, effort {}, estimate {}): {}\n  Build recommendation: {}".format
+
+
+def _coerced_field(key: str, coerce: Callable[[Any], Any]) -> Callable[[dict[str, Any]], Any]:
+    def extract(row: dict[str, Any]) -> Any:
+        return coerce(row.get(key) or 0)
+
+    return extract
+
+
+def _row_symbol(row: dict[str, Any]) -> str:
+    return str(row.get("underlying_symbol") or row.get("symbol") or "UNKNOWN")
+
+
+# Log fields the digests read column-wise, each mapped to its per-row extractor.
+_COLUMN_EXTRACTORS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "account_equity": _coerced_field("account_equity", float),
+    "execute_orders": _coerced_field("execute_orders", bool),
+    "orders_proposed": _coerced_field("orders_proposed", int),
+    "signals_generated": _coerced_field("signals_generated", int),
+    "symbol": _row_symbol,
+}
+
+
+def _split_resolved_calls(
+    journal: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Return ``(good_calls, bad_calls)`` resolved-call events from the decision journal in one pass."""
+    good: list[dict[str, Any]] = []
+    bad: list[dict[str, Any]] = []
+    for event in journal:
+        if event.get("event") != EVENT_CALL_RESOLVED:
+            continue
+        outcome = event.get("outcome")
+        if outcome == "bad_call":
+            bad.append(event)
+        elif outcome == "good_call":
+            good.append(event)
+    return good, bad
+
+
+def _research_source_counts(metadata_events: list[dict[str, Any]]) -> Counter[str]:
+    """Total ``research_items_by_source`` counts across cycle metadata events."""
+    counts: Counter[str] = Counter()
+    for event in metadata_events:
+        by_source = event.get("research_items_by_source")
+        if isinstance(by_source, dict):
+            counts.update(
+                {str(key): int(value) for key, value in by_source.items() if isinstance(value, (int, float))}
+            )
+    return counts
+
+
+def _finite_or_none(value: Any) -> Any:
+    """Copy of ``value`` with NaN/Infinity floats replaced by ``None``, as orjson encodes them."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite_or_none(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_or_none(item) for item in value]
+    return value
+
+
+def _jsonl_line(payload: dict[str, Any]) -> bytes:
+    """Serialize one log record as a compact, key-sorted UTF-8 JSON line.
+
+    Both encoders produce equivalent JSON, with non-finite floats written as
+    ``null``. The bytes can still differ: orjson writes raw UTF-8 and ``1e16``
+    where ``json`` writes ``\\u00e9`` escapes and ``1e+16``.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            payload,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+        )
+    try:
+        text = json.dumps(payload, sort_keys=True, separators=(",", ":"), allow_nan=False)
+    except ValueError:
+        text = json.dumps(_finite_or_none(payload), sort_keys=True, separators=(",", ":"), allow_nan=False)
+    return (text + "\n").encode("utf-8")
+
+
+# Low-cardinality fields compared in every digest filter; interned so cached rows
+# share one string object per value.
+_INTERNED_FIELDS = ("event", "outcome", "instruction")
+
+
+def _parse_jsonl_lines(lines: Iterable[bytes], rows: list[dict[str, Any]]) -> None:
+    """Append each line that decodes to a JSON object onto ``rows``."""
+    for raw in lines:
+        line = raw.strip()
+        if not line:
+            continue
+        try:
+            payload = _json_loads(line)
+        except ValueError:
+            continue
+        if isinstance(payload, dict):
+            for key in _INTERNED_FIELDS:
+                value = payload.get(key)
+                if type(value) is str:
+                    payload[key] = sys.intern(value)
+            rows.append(payload)
+
+
+def _iter_reverse_lines(path: Path, *, block_size: int = 1 << 20) -> Iterator[bytes]:
+    """Yield the non-empty lines of ``path`` from last to first.
+
+    Reads fixed-size blocks backwards from EOF so callers that only need the
+    tail of an append-only log never touch the rest of the file.
+    """
+    with path.open("rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            step = min(block_size, position)
+            position -= step
+            handle.seek(position)
+            chunk = handle.read(step) + remainder
+            lines = chunk.split(b"\n")
+            # The first piece may be a partial line; carry it into the next block.
+            remainder = lines[0]
+            for line in reversed(lines[1:]):
+                line = line.strip()
+                if line:
+                    yield line
+        remainder = remainder.strip()
+        if remainder:
+            yield remainder
+
+
+@dataclass
+class _JsonlCacheEntry:
+    """Parsed rows of one append-only report log, kept for the life of the manager.
+
+    Rows are never evicted, so memory grows with log history: about 2.5 KB per
+    recorded cycle across the portfolio and metadata logs (day index and typed
+    columns included), plus the trade and decision-journal rows. At the
+    default 5-minute interval with the market-hours guard that is on the
+    order of 50 MB per year of history. This is accepted because the public
+    digest builders take any date window and must see the full history, and
+    ``day_index``/``columns`` hold positional indices into ``rows`` that
+    trimming would invalidate. Archiving old log files bounds it.
+    """
+
+    inode: int
+    offset: int
+    rows: list[dict[str, Any]]
+    mtime_ns: int = 0
+    # Report-timezone date -> ascending row indices; built lazily for rows[:indexed_rows].
+    day_index: dict[date, list[int]] = field(default_factory=dict)
+    indexed_rows: int = 0
+    # Field name -> typed values parallel to a prefix of rows; see _read_column_between.
+    columns: dict[str, list[Any]] = field(default_factory=dict)
+
+
+def _append_log_bytes(path: Path, data: bytes, ensured_dirs: set[Path]) -> None:
+    try:
+        parent = path.parent
+        if parent not in ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            ensured_dirs.add(parent)
+        with path.open("ab", buffering=1 << 16) as handle:
+            handle.write(data)
+    except Exception as exc:
+        logging.warning("Failed writing report log %s: %s", path, exc)
+
+
+def _write_log_batch(batch: list[tuple[Path, bytes]], ensured_dirs: set[Path]) -> None:
+    """Append queued log bytes in order, with one write per path."""
+    by_path: dict[Path, list[bytes]] = {}
+    for path, data in batch:
+        by_path.setdefault(path, []).append(data)
+    for path, chunks in by_path.items():
+        _append_log_bytes(path, b"".join(chunks), ensured_dirs)
+
+
+class _LogWriter:
+    """Background thread that appends queued report-log bytes, coalesced per path.
+
+    It holds no reference to its ReportManager, so the manager can still be
+    collected; a ``weakref.finalize`` on the manager closes the writer then, or
+    at interpreter exit.
+    """
+
+    def __init__(self, ensured_dirs: set[Path], maxsize: int) -> None:
+        self._ensured_dirs = ensured_dirs
+        self._maxsize = maxsize
+        self._cond = threading.Condition()
+        self._pending: list[tuple[Path, bytes]] = []
+        self._busy = False
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="report-log-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped
+
+    def submit(self, path: Path, data: bytes, *, timeout: float) -> bool:
+        """Queue ``data`` for ``path``; False if the writer stopped or stayed full for ``timeout`` seconds."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._stopped or len(self._pending) < self._maxsize, timeout):
+                return False
+            if self._stopped:
+                return False
+            self._pending.append((path, data))
+            self._cond.notify_all()
+            return True
+
+    def flush(self) -> None:
+        """Block until everything queued so far is written, or the writer has stopped."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._stopped or (not self._pending and not self._busy))
+
+    def close(self) -> None:
+        """Stop the thread and write whatever it left queued, after its in-flight batch, in order."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: not self._busy)
+            leftovers, self._pending = self._pending, []
+        _write_log_batch(leftovers, self._ensured_dirs)
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._pending or self._stopped)
+                    if not self._pending:
+                        return
+                    batch, self._pending = self._pending, []
+                    self._busy = True
+                    self._cond.notify_all()
+                try:
+                    _write_log_batch(batch, self._ensured_dirs)
+                finally:
+                    with self._cond:
+                        self._busy = False
+                        self._cond.notify_all()
+        finally:
+            with self._cond:
+                self._stopped = True
+                self._cond.notify_all()
+
 
 @dataclass
 class ReportState:
@@ -50,8 +645,31 @@ class ReportManager:
         self.decision_journal_path = Path(config.decision_journal_path)
         self.report_tz = self._resolve_timezone(config.report_timezone)
 
+        self._ensured_dirs: set[Path] = {Path(".")}
+        # (utc_start, utc_end, day) for the last report day resolved by _event_date.
+        self._event_day_window: tuple[str, str, date] | None = None
+        # Append-only logs are parsed incrementally and indexed by report date on demand.
+        self._jsonl_cache: dict[Path, _JsonlCacheEntry] = {}
+        # Logs already brought up to date during the current report sweep; None outside one.
+        self._fresh_paths: set[Path] | None = None
+        # (start, end) -> quarter metrics evaluated during the current report sweep.
+        self._quarter_metrics_memo: dict[tuple[date, date], dict[str, Any] | None] = {}
+        # (path, event) -> ((inode, mtime_ns, size), newest matching row) for _latest_report_event.
+        self._latest_event_cache: dict[tuple[Path, str], tuple[tuple[int, int, int], dict[str, Any] | None]] = {}
+        # ((path, mtime_ns, size), penalties) for the last decision-learning state read.
+        self._feature_penalties_cache: tuple[tuple[Path, int, int], dict[str, float]] | None = None
+
+        self._log_writer: _LogWriter | None = None
+        self._log_writer_finalizer: weakref.finalize | None = None
+        if config.report_async_writes:
+            self._log_writer = _LogWriter(self._ensured_dirs, WRITE_QUEUE_MAXSIZE)
+            # Runs on close(), when the manager is collected, or at interpreter exit.
+            self._log_writer_finalizer = weakref.finalize(self, self._log_writer.close)
+
         self.state = self._load_state()
-        self._research_seen_ids = self._load_recent_research_ids(limit=20000)
+        recent_research_ids = self._load_recent_research_ids(limit=RESEARCH_DEDUPE_WINDOW)
+        self._research_seen_order: deque[str] = deque(recent_research_ids)
+        self._research_seen_ids: set[str] = set(recent_research_ids)
 
     @staticmethod
     def _resolve_timezone(name: str) -> ZoneInfo:
@@ -66,7 +684,7 @@ class ReportManager:
             return ReportState()
 
         try:
-            payload = json.loads(self.state_path.read_text(encoding="utf-8"))
+            payload = _json_loads(self.state_path.read_bytes())
         except Exception:
             return ReportState()
 
@@ -82,19 +700,18 @@ class ReportManager:
         )
 
     def _save_state(self) -> None:
-        payload = {
-            "last_daily_report_date": self.state.last_daily_report_date,
-            "last_weekly_report_key": self.state.last_weekly_report_key,
-            "last_quarterly_advisor_target": self.state.last_quarterly_advisor_target,
-            "last_model_roadmap_target": self.state.last_model_roadmap_target,
-            "last_bootstrap_optimization_date": self.state.last_bootstrap_optimization_date,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-        }
+        payload = asdict(self.state)
+        payload["updated_at"] = datetime.now(timezone.utc).isoformat()
+        if orjson is not None:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(payload, indent=2).encode("utf-8")
 
         try:
-            if self.state_path.parent != Path("."):
-                self.state_path.parent.mkdir(parents=True, exist_ok=True)
-            self.state_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            self._ensure_parent_dir(self.state_path)
+            tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.state_path)
         except Exception as exc:
             logging.warning("Failed to persist report state %s: %s", self.state_path, exc)
 
@@ -110,84 +727,131 @@ class ReportManager:
             return parsed.replace(tzinfo=timezone.utc)
         return parsed.astimezone(timezone.utc)
 
+    def _ensure_parent_dir(self, path: Path) -> None:
+        parent = path.parent
+        if parent in self._ensured_dirs:
+            return
+        parent.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(parent)
+
     def _append_jsonl(self, path: Path, payload: dict[str, Any]) -> None:
-        try:
-            if path.parent != Path("."):
-                path.parent.mkdir(parents=True, exist_ok=True)
-            with path.open("a", encoding="utf-8") as handle:
-                handle.write(json.dumps(payload, sort_keys=True) + "\n")
-        except Exception as exc:
-            logging.warning("Failed writing report log %s: %s", path, exc)
+        self._append_jsonl_many(path, [payload])
 
-    def _load_recent_research_ids(self, *, limit: int) -> set[str]:
+    def _append_jsonl_many(self, path: Path, payloads: list[dict[str, Any]]) -> None:
+        lines: list[bytes] = []
+        for payload in payloads:
+            # An unencodable record is dropped on its own; the rest of the batch is still written.
+            try:
+                lines.append(_jsonl_line(payload))
+            except Exception as exc:
+                logging.warning("Failed writing report log %s: %s", path, exc)
+        if not lines:
+            return
+        data = b"".join(lines)
+        if self._fresh_paths is not None:
+            self._fresh_paths.discard(path)
+            if path in (self.portfolio_path, self.activity_path, self.decision_journal_path, self.metadata_path):
+                self._quarter_metrics_memo.clear()
+        writer = self._log_writer
+        if writer is not None:
+            if writer.submit(path, data, timeout=WRITE_QUEUE_PUT_TIMEOUT):
+                return
+            logging.warning("Report log writer is unavailable or backed up; writing report logs synchronously.")
+            self.close()
+        _append_log_bytes(path, data, self._ensured_dirs)
+
+    def flush(self) -> None:
+        """Block until queued log writes have reached disk (no-op for synchronous writes)."""
+        writer = self._log_writer
+        if writer is None:
+            return
+        writer.flush()
+        if writer.stopped:
+            # The writer thread exited early; write what it left and stay synchronous.
+            self.close()
+
+    def close(self) -> None:
+        """Flush queued log writes and stop the background writer, if any."""
+        finalizer = self._log_writer_finalizer
+        self._log_writer = None
+        self._log_writer_finalizer = None
+        if finalizer is not None:
+            finalizer()
+
+    def _load_recent_research_ids(self, *, limit: int) -> list[str]:
+        """Return up to ``limit`` research item ids from the log tail, oldest first."""
         if not self.research_path.exists():
-            return set()
+            return []
 
+        newest_first: list[str] = []
         try:
-            lines = self.research_path.read_text(encoding="utf-8").splitlines()
+            for count, raw in enumerate(_iter_reverse_lines(self.research_path), start=1):
+                if limit > 0 and count > limit:
+                    break
+                match = _ITEM_ID_RE.search(raw)
+                if match is not None:
+                    newest_first.append(match.group(1).decode("ascii"))
+                    continue
+                try:
+                    payload = _json_loads(raw)
+                except Exception:
+                    continue
+                if not isinstance(payload, dict):
+                    continue
+                item_id = str(payload.get("item_id") or "").strip()
+                if item_id:
+                    newest_first.append(item_id)
         except Exception:
-            return set()
-
-        if limit > 0 and len(lines) > limit:
-            lines = lines[-limit:]
+            return []
+        return list(dict.fromkeys(reversed(newest_first)))
 
-        seen: set[str] = set()
-        for raw in lines:
-            line = raw.strip()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line)
-            except Exception:
-                continue
-            if not isinstance(payload, dict):
-                continue
-            item_id = str(payload.get("item_id") or "").strip()
-            if item_id:
-                seen.add(item_id)
-        return seen
+    def _remember_research_id(self, item_id: str) -> bool:
+        """Record ``item_id`` in the dedupe window; return False if it was already seen."""
+        if item_id in self._research_seen_ids:
+            return False
+        self._research_seen_ids.add(item_id)
+        self._research_seen_order.append(item_id)
+        if len(self._research_seen_order) > RESEARCH_DEDUPE_WINDOW:
+            self._research_seen_ids.discard(self._research_seen_order.popleft())
+        return True
 
     @staticmethod
     def _research_item_id(item: dict[str, Any]) -> str:
-        key = "|".join(
-            [
-                str(item.get("symbol") or "").upper().strip(),
-                str(item.get("source_type") or "").strip().lower(),
-                str(item.get("title") or "").strip(),
-                str(item.get("link") or "").strip(),
-                str(item.get("published_at") or "").strip(),
-            ]
+        return _research_digest(
+            _text(item.get("symbol")).upper(),
+            _text(item.get("source_type")).lower(),
+            _text(item.get("title")),
+            _text(item.get("link")),
+            _text(item.get("published_at")),
         )
-        return hashlib.sha1(key.encode("utf-8")).hexdigest()
 
     def record_cycle(self, summary: dict[str, Any], *, timestamp: datetime | None = None) -> None:
-        now = (timestamp or datetime.now(timezone.utc)).astimezone(timezone.utc)
+        now = timestamp or datetime.now(timezone.utc)
+        if now.tzinfo is not timezone.utc:
+            now = now.astimezone(timezone.utc)
         ts = now.isoformat()
 
-        signal_map_raw = summary.get("signal_map")
-        signal_map = signal_map_raw if isinstance(signal_map_raw, dict) else {}
+        signal_map = _dict_field(summary, "signal_map")
 
         snapshot_event = {
             "event": "portfolio_snapshot",
             "timestamp": ts,
             "cash": float(summary.get("cash", 0.0) or 0.0),
             "account_equity": float(summary.get("account_equity", summary.get("cash", 0.0)) or 0.0),
-            "equity_positions": summary.get("equity_positions") if isinstance(summary.get("equity_positions"), dict) else {},
-            "option_positions": summary.get("option_positions") if isinstance(summary.get("option_positions"), dict) else {},
+            "equity_positions": _dict_field(summary, "equity_positions"),
+            "option_positions": _dict_field(summary, "option_positions"),
         }
         self._append_jsonl(self.portfolio_path, snapshot_event)
 
         if self.config.enable_metadata_logging:
-            decision_meta_raw = summary.get("decision_metadata")
-            decision_meta = decision_meta_raw if isinstance(decision_meta_raw, dict) else {}
-            collection_meta_raw = summary.get("collection_metadata")
-            collection_meta = collection_meta_raw if isinstance(collection_meta_raw, dict) else {}
+            decision_meta = _dict_field(summary, "decision_metadata")
+            collection_meta = _dict_field(summary, "collection_metadata")
             meta_event = {
                 "event": "cycle_metadata",
                 "timestamp": ts,
                 "execute_orders": bool(summary.get("execute_orders", True)),
                 "lookback_hours_override": summary.get("lookback_hours_override"),
-                "bootstrap": summary.get("bootstrap") if isinstance(summary.get("bootstrap"), dict) else {},
+                "bootstrap": _dict_field(summary, "bootstrap"),
                 "signals_generated": int(decision_meta.get("signals_generated", 0) or 0),
                 "orders_proposed": int(decision_meta.get("orders_proposed", 0) or 0),
                 "no_trade_reason": str(decision_meta.get("no_trade_reason") or ""),
@@ -195,12 +859,8 @@ class ReportManager:
                 "symbols_with_market_data": int(collection_meta.get("symbols_with_market_data", 0) or 0),
                 "symbols_with_research": int(collection_meta.get("symbols_with_research", 0) or 0),
                 "research_items_total": int(collection_meta.get("research_items_total", 0) or 0),
-                "research_items_by_source": (
-                    collection_meta.get("research_items_by_source")
-                    if isinstance(collection_meta.get("research_items_by_source"), dict)
-                    else {}
-                ),
-                "source_bias": summary.get("source_bias") if isinstance(summary.get("source_bias"), dict) else {},
+                "research_items_by_source": _dict_field(collection_meta, "research_items_by_source"),
+                "source_bias": _dict_field(summary, "source_bias"),
                 "decision_metadata": decision_meta,
                 "collection_metadata": collection_meta,
             }
@@ -208,46 +868,53 @@ class ReportManager:
 
         research_items_raw = summary.get("research_items")
         research_items = research_items_raw if isinstance(research_items_raw, list) else []
+        research_events: list[dict[str, Any]] = []
         for raw_item in research_items:
             if not isinstance(raw_item, dict):
                 continue
-            item_id = self._research_item_id(raw_item)
-            if item_id in self._research_seen_ids:
+            item_symbol = _text(raw_item.get("symbol")).upper()
+            source_type = _text(raw_item.get("source_type")).lower()
+            title = _text(raw_item.get("title"))
+            link = _text(raw_item.get("link"))
+            published_at = _text(raw_item.get("published_at"))
+            item_id = _research_digest(item_symbol, source_type, title, link, published_at)
+            if not self._remember_research_id(item_id):
                 continue
-            self._research_seen_ids.add(item_id)
+            key_points = raw_item.get("key_points")
             event = {
                 "event": "research_item",
                 "timestamp": ts,
                 "item_id": item_id,
-                "symbol": str(raw_item.get("symbol") or "").upper().strip(),
-                "source_type": str(raw_item.get("source_type") or "").strip().lower(),
-                "source": str(raw_item.get("source") or "").strip(),
-                "title": str(raw_item.get("title") or "").strip(),
-                "description": str(raw_item.get("description") or "").strip(),
-                "summary": str(raw_item.get("summary") or "").strip(),
-                "key_points": raw_item.get("key_points") if isinstance(raw_item.get("key_points"), list) else [],
-                "link": str(raw_item.get("link") or "").strip(),
-                "published_at": str(raw_item.get("published_at") or "").strip(),
+                "symbol": item_symbol,
+                "source_type": source_type,
+                "source": _text(raw_item.get("source")),
+                "title": title,
+                "description": _text(raw_item.get("description")),
+                "summary": _text(raw_item.get("summary")),
+                "key_points": key_points if isinstance(key_points, list) else [],
+                "link": link,
+                "published_at": published_at,
             }
-            self._append_jsonl(self.research_path, event)
+            research_events.append(event)
+        self._append_jsonl_many(self.research_path, research_events)
 
         orders = summary.get("orders")
         if not isinstance(orders, list):
             return
 
+        trade_events: list[dict[str, Any]] = []
         for order in orders:
             if not isinstance(order, dict):
                 continue
 
-            symbol = str(order.get("symbol") or "").upper().strip()
+            symbol = _text(order.get("symbol")).upper()
             if not symbol:
                 continue
 
-            asset_type = str(order.get("asset_type") or "").upper().strip() or "UNKNOWN"
+            asset_type = _text(order.get("asset_type")).upper() or "UNKNOWN"
             underlying = option_underlying(symbol) if asset_type == "OPTION" else symbol
 
-            signal_payload = signal_map.get(underlying)
-            signal = signal_payload if isinstance(signal_payload, dict) else {}
+            signal = _dict_field(signal_map, underlying)
 
             event = {
                 "event": "trade_decision",
@@ -261,48 +928,95 @@ class ReportManager:
                 "reason": str(order.get("reason") or ""),
                 "signal": signal,
             }
-            self._append_jsonl(self.activity_path, event)
+            trade_events.append(event)
+        self._append_jsonl_many(self.activity_path, trade_events)
+
+    @contextlib.contextmanager
+    def _report_sweep(self) -> Iterator[None]:
+        """Treat each log as unchanged after its first read until the sweep ends.
+
+        Reports built back to back then share one stat-and-parse per log.
+        Writes made through this manager still invalidate the affected path.
+        """
+        if self._fresh_paths is not None:
+            yield
+            return
+        self._fresh_paths = set()
+        try:
+            yield
+        finally:
+            self._fresh_paths = None
+            self._quarter_metrics_memo.clear()
 
     def maybe_send_scheduled_reports(self, *, now: datetime | None = None) -> None:
+        with self._report_sweep():
+            self._send_due_reports(now)
+
+    def _send_due_reports(self, now: datetime | None) -> None:
         current = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
-        self._maybe_send_bootstrap_optimization(current)
-        self._maybe_send_quarterly_advisor(current)
-        self._maybe_send_model_roadmap_advisor(current)
+        current_local = current.astimezone(self.report_tz)
+
+        # Cheap gates first: most ticks are before every report hour or after
+        # today's report was already stored, so skip the helpers entirely.
+        config = self.config
+        hour = current_local.hour
+        today_key = current_local.date().isoformat()
+        if (
+            config.enable_bootstrap_optimization_reports
+            and hour >= config.bootstrap_optimization_hour_local
+            and self.state.last_bootstrap_optimization_date != today_key
+        ):
+            self._maybe_send_bootstrap_optimization(current, current_local)
+        if config.enable_quarterly_model_advisor and hour >= config.quarterly_model_advisor_hour_local:
+            self._maybe_send_quarterly_advisor(current, current_local)
+        if config.enable_model_roadmap_advisor and hour >= config.model_roadmap_hour_local:
+            self._maybe_send_model_roadmap_advisor(current, current_local)
+
+        if hour >= config.daily_report_hour_local and self.state.last_daily_report_date != today_key:
+            self._maybe_send_daily(current, current_local)
+        if hour >= config.weekly_report_hour_local:
+            self._maybe_send_weekly(current, current_local)
 
-        self._maybe_send_daily(current)
-        self._maybe_send_weekly(current)
+    def _latest_report_event(self, path: Path, event_name: str) -> dict[str, Any] | None:
+        """Return the newest ``event_name`` row in ``path``, memoized until the file changes.
 
-    @staticmethod
-    def _quarter_start_for(day: date) -> date:
-        month = ((day.month - 1) // 3) * 3 + 1
-        return date(day.year, month, 1)
-
-    @classmethod
-    def _next_quarter_start(cls, day: date) -> date:
-        start = cls._quarter_start_for(day)
-        month = start.month + 3
-        year = start.year
-        if month > 12:
-            month = 1
-            year += 1
-        return date(year, month, 1)
+        The returned dict is shared with the cache and must not be mutated.
+        """
+        self.flush()
+        try:
+            stat = path.stat()
+        except OSError:
+            self._latest_event_cache.pop((path, event_name), None)
+            return None
 
-    @staticmethod
-    def _quarter_index(day: date) -> int:
-        return ((day.month - 1) // 3) + 1
+        version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cached = self._latest_event_cache.get((path, event_name))
+        if cached is not None and cached[0] == version:
+            return cached[1]
 
-    def _latest_report_event(self, path: Path, event_name: str) -> dict[str, Any] | None:
-        rows = self._read_jsonl(path)
-        for row in reversed(rows):
-            if str(row.get("event") or "") == event_name and isinstance(row, dict):
-                return row
-        return None
+        # Report logs are append-only, so the newest match is almost always the last line.
+        needle = json.dumps(event_name).encode("utf-8")
+        latest: dict[str, Any] | None = None
+        try:
+            for raw in _iter_reverse_lines(path, block_size=1 << 16):
+                if needle not in raw:
+                    continue
+                try:
+                    row = _json_loads(raw)
+                except ValueError:
+                    continue
+                if isinstance(row, dict) and row.get("event") == event_name:
+                    latest = row
+                    break
+        except Exception:
+            return None
+        self._latest_event_cache[(path, event_name)] = (version, latest)
+        return latest
 
-    def _maybe_send_bootstrap_optimization(self, now: datetime) -> None:
+    def _maybe_send_bootstrap_optimization(self, now: datetime, now_local: datetime) -> None:
         if not self.config.enable_bootstrap_optimization_reports:
             return
 
-        now_local = now.astimezone(self.report_tz)
         if now_local.hour < self.config.bootstrap_optimization_hour_local:
             return
 
@@ -318,7 +1032,7 @@ class ReportManager:
         self._append_jsonl(
             self.bootstrap_optimization_path,
             {
-                "event": "bootstrap_optimization_report",
+                "event": EVENT_BOOTSTRAP_OPTIMIZATION,
                 "timestamp": now.isoformat(),
                 "report_date": report_key,
                 "subject": payload["subject"],
@@ -339,11 +1053,7 @@ class ReportManager:
         self._save_state()
 
     def build_bootstrap_optimization_digest(self, report_date: date) -> dict[str, Any] | None:
-        metadata_events = [
-            event
-            for event in self._read_jsonl(self.metadata_path)
-            if self._event_date(event) == report_date
-        ]
+        metadata_events = self._read_jsonl_between(self.metadata_path, report_date, report_date)
         bootstrap_events = [
             event
             for event in metadata_events
@@ -353,35 +1063,35 @@ class ReportManager:
             return None
 
         cycle_count = len(bootstrap_events)
-        avg_market_symbols = sum(
-            int(event.get("symbols_with_market_data", 0) or 0) for event in bootstrap_events
-        ) / cycle_count
-        avg_research_symbols = sum(
-            int(event.get("symbols_with_research", 0) or 0) for event in bootstrap_events
-        ) / cycle_count
-        avg_research_items = sum(
-            int(event.get("research_items_total", 0) or 0) for event in bootstrap_events
-        ) / cycle_count
-        avg_signals = sum(
-            int(event.get("signals_generated", 0) or 0) for event in bootstrap_events
-        ) / cycle_count
-        avg_orders = sum(
-            int(event.get("orders_proposed", 0) or 0) for event in bootstrap_events
-        ) / cycle_count
-        feedback_events = sum(
-            int((event.get("collection_metadata") or {}).get("historical_pattern_feedback_events", 0) or 0)
-            for event in bootstrap_events
-            if isinstance(event.get("collection_metadata"), dict)
-        )
-
+        market_symbols_total = 0
+        research_symbols_total = 0
+        research_items_total = 0
+        signals_total = 0
+        orders_total = 0
+        feedback_events = 0
         source_variety_values: list[int] = []
         for event in bootstrap_events:
+            market_symbols_total += _count(event.get("symbols_with_market_data"))
+            research_symbols_total += _count(event.get("symbols_with_research"))
+            research_items_total += _count(event.get("research_items_total"))
+            signals_total += _count(event.get("signals_generated"))
+            orders_total += _count(event.get("orders_proposed"))
+
+            collection_meta = event.get("collection_metadata")
+            if isinstance(collection_meta, dict):
+                feedback_events += _count(collection_meta.get("historical_pattern_feedback_events"))
+
             by_source = event.get("research_items_by_source")
-            if not isinstance(by_source, dict):
-                continue
-            source_variety_values.append(
-                sum(1 for value in by_source.values() if isinstance(value, (int, float)) and int(value) > 0)
-            )
+            if isinstance(by_source, dict):
+                source_variety_values.append(
+                    sum(1 for value in by_source.values() if isinstance(value, (int, float)) and int(value) > 0)
+                )
+
+        avg_market_symbols = market_symbols_total / cycle_count
+        avg_research_symbols = research_symbols_total / cycle_count
+        avg_research_items = research_items_total / cycle_count
+        avg_signals = signals_total / cycle_count
+        avg_orders = orders_total / cycle_count
         avg_source_variety = (
             sum(source_variety_values) / len(source_variety_values)
             if source_variety_values
@@ -415,7 +1125,7 @@ class ReportManager:
             "cycles": cycle_count,
         }
 
-        previous = self._latest_report_event(self.bootstrap_optimization_path, "bootstrap_optimization_report")
+        previous = self._latest_report_event(self.bootstrap_optimization_path, EVENT_BOOTSTRAP_OPTIMIZATION)
         previous_metrics = previous.get("metrics") if isinstance(previous, dict) and isinstance(previous.get("metrics"), dict) else {}
         comparison = {
             "ingestion_efficiency_delta": round(
@@ -492,16 +1202,15 @@ class ReportManager:
             "suggestions": suggestions,
         }
 
-    def _maybe_send_quarterly_advisor(self, now: datetime) -> None:
+    def _maybe_send_quarterly_advisor(self, now: datetime, now_local: datetime) -> None:
         if not self.config.enable_quarterly_model_advisor:
             return
 
-        now_local = now.astimezone(self.report_tz)
         if now_local.hour < self.config.quarterly_model_advisor_hour_local:
             return
 
         today = now_local.date()
-        target_start = self._next_quarter_start(today)
+        target_start = _next_quarter_start(today)
         days_until = (target_start - today).days
         if days_until < 0 or days_until > self.config.quarterly_model_advisor_reminder_days:
             return
@@ -519,7 +1228,7 @@ class ReportManager:
         self._append_jsonl(
             self.quarterly_advisor_path,
             {
-                "event": "quarterly_model_advisor",
+                "event": EVENT_QUARTERLY_ADVISOR,
                 "timestamp": now.isoformat(),
                 "target_quarter_start": target_key,
                 "subject": subject,
@@ -539,17 +1248,16 @@ class ReportManager:
         self.state.last_quarterly_advisor_target = target_key
         self._save_state()
 
-    def _maybe_send_model_roadmap_advisor(self, now: datetime) -> None:
+    def _maybe_send_model_roadmap_advisor(self, now: datetime, now_local: datetime) -> None:
         if not self.config.enable_model_roadmap_advisor:
             return
 
-        now_local = now.astimezone(self.report_tz)
         if now_local.hour < self.config.model_roadmap_hour_local:
             return
 
         today = now_local.date()
-        target_start = self._next_quarter_start(today)
-        target_quarter = self._quarter_index(target_start)
+        target_start = _next_quarter_start(today)
+        target_quarter = _quarter_index(target_start)
         if target_quarter not in self.config.model_roadmap_target_quarters:
             return
 
@@ -570,7 +1278,7 @@ class ReportManager:
         self._append_jsonl(
             self.model_roadmap_path,
             {
-                "event": "model_roadmap_advisor",
+                "event": EVENT_MODEL_ROADMAP,
                 "timestamp": now.isoformat(),
                 "target_quarter_start": target_key,
                 "target_quarter": target_quarter,
@@ -591,8 +1299,7 @@ class ReportManager:
         self.state.last_model_roadmap_target = target_key
         self._save_state()
 
-    def _maybe_send_daily(self, now: datetime) -> None:
-        now_local = now.astimezone(self.report_tz)
+    def _maybe_send_daily(self, now: datetime, now_local: datetime) -> None:
         if now_local.hour < self.config.daily_report_hour_local:
             return
 
@@ -612,7 +1319,7 @@ class ReportManager:
         self._append_jsonl(
             self.daily_report_path,
             {
-                "event": "daily_report",
+                "event": EVENT_DAILY_REPORT,
                 "timestamp": now.isoformat(),
                 "report_date": report_key,
                 "subject": subject,
@@ -622,8 +1329,7 @@ class ReportManager:
         self.state.last_daily_report_date = report_key
         self._save_state()
 
-    def _maybe_send_weekly(self, now: datetime) -> None:
-        now_local = now.astimezone(self.report_tz)
+    def _maybe_send_weekly(self, now: datetime, now_local: datetime) -> None:
         if now_local.hour < self.config.weekly_report_hour_local:
             return
 
@@ -651,7 +1357,7 @@ class ReportManager:
         self._append_jsonl(
             self.weekly_report_path,
             {
-                "event": "weekly_report",
+                "event": EVENT_WEEKLY_REPORT,
                 "timestamp": now.isoformat(),
                 "week_key": week_key,
                 "range_end": end_date.isoformat(),
@@ -681,52 +1387,30 @@ class ReportManager:
         return candidates[-1]
 
     def build_daily_digest(self, report_date: date) -> tuple[str, str] | None:
-        events = [
-            event
-            for event in self._read_jsonl(self.activity_path)
-            if self._event_date(event) == report_date
-        ]
-        snapshots = [
-            event
-            for event in self._read_jsonl(self.portfolio_path)
-            if self._event_date(event) == report_date
-        ]
+        self._prefetch_report_logs()
+        events = self._read_jsonl_between(self.activity_path, report_date, report_date)
+        equity_series = self._read_column_between(self.portfolio_path, "account_equity", report_date, report_date)
 
-        decision_events = [
-            event
-            for event in self._read_jsonl(self.decision_journal_path)
-            if self._event_date(event) == report_date
-        ]
-        metadata_events = [
-            event
-            for event in self._read_jsonl(self.metadata_path)
-            if self._event_date(event) == report_date
-        ]
+        decision_events = self._read_jsonl_between(self.decision_journal_path, report_date, report_date)
+        metadata_events = self._read_jsonl_between(self.metadata_path, report_date, report_date)
 
-        if not events and not snapshots and not decision_events and not metadata_events:
+        if not events and not equity_series and not decision_events and not metadata_events:
             return None
 
         prefix = self.config.report_subject_prefix.strip() or "AI Trader"
         subject = f"[{prefix}] Daily Decision Digest - {report_date.isoformat()}"
 
-        lines: list[str] = []
-        lines.append(f"Daily trading and model report for {report_date.isoformat()} (UTC).")
-        lines.append("")
+        lines: list[str] = [f"Daily trading and model report for {report_date.isoformat()} (UTC).", ""]
 
-        if snapshots:
-            first_equity = float(snapshots[0].get("account_equity", 0.0) or 0.0)
-            last_equity = float(snapshots[-1].get("account_equity", 0.0) or 0.0)
+        if equity_series:
+            first_equity, last_equity, _, trough, _ = _equity_stats(equity_series, missing_as_first=True)
             delta = last_equity - first_equity
             pct = (delta / first_equity * 100.0) if first_equity > 0 else 0.0
             lines.append(
                 f"Portfolio snapshot: start ${first_equity:,.2f} -> end ${last_equity:,.2f} "
                 f"({delta:+,.2f}, {pct:+.2f}%)."
             )
-            drawdown_pct = (
-                ((first_equity - min(float(event.get("account_equity", first_equity) or first_equity) for event in snapshots)) / first_equity)
-                if first_equity > 0
-                else 0.0
-            )
+            drawdown_pct = ((first_equity - trough) / first_equity) if first_equity > 0 else 0.0
             goal_lines = self._goal_progress_lines(
                 report_date=report_date,
                 end_equity=last_equity,
@@ -739,25 +1423,19 @@ class ReportManager:
         if metadata_events:
             lines.append("System metadata (learn/survival telemetry):")
             cycle_count = len(metadata_events)
-            avg_signals = sum(int(event.get("signals_generated", 0) or 0) for event in metadata_events) / cycle_count
-            trading_cycles = sum(1 for event in metadata_events if bool(event.get("execute_orders", False)))
-            cycles_with_orders = sum(
-                1 for event in metadata_events if int(event.get("orders_proposed", 0) or 0) > 0
-            )
+            signals = self._read_column_between(self.metadata_path, "signals_generated", report_date, report_date)
+            execute = self._read_column_between(self.metadata_path, "execute_orders", report_date, report_date)
+            orders = self._read_column_between(self.metadata_path, "orders_proposed", report_date, report_date)
+            avg_signals = sum(signals) / cycle_count
+            trading_cycles = sum(execute)
+            cycles_with_orders = sum(1 for count in orders if count > 0)
             no_trade_cycles = max(0, trading_cycles - cycles_with_orders)
             lines.append(
                 f"- Cycles run: {cycle_count}, avg signals/cycle: {avg_signals:.2f}, "
                 f"trade-capable cycles with no orders: {no_trade_cycles}"
             )
 
-            source_counts: dict[str, int] = defaultdict(int)
-            for event in metadata_events:
-                by_source = event.get("research_items_by_source")
-                if not isinstance(by_source, dict):
-                    continue
-                for key, value in by_source.items():
-                    if isinstance(value, (int, float)):
-                        source_counts[str(key)] += int(value)
+            source_counts = _research_source_counts(metadata_events)
             if source_counts:
                 source_text = ", ".join(
                     f"{key}={count}" for key, count in sorted(source_counts.items(), key=lambda item: item[0])
@@ -766,23 +1444,23 @@ class ReportManager:
 
             latest_bias = metadata_events[-1].get("source_bias")
             if isinstance(latest_bias, dict) and latest_bias:
-                ranked_bias = sorted(
+                ranked_bias = heapq.nlargest(
+                    6,
                     (
                         (str(key), float(value))
                         for key, value in latest_bias.items()
                         if isinstance(value, (int, float))
                     ),
                     key=lambda item: abs(item[1]),
-                    reverse=True,
                 )
                 if ranked_bias:
-                    top_text = ", ".join(f"{key}={value:+.3f}" for key, value in ranked_bias[:6])
+                    top_text = ", ".join(f"{key}={value:+.3f}" for key, value in ranked_bias)
                     lines.append(f"- Learned source priority bias: {top_text}")
             lines.append("")
 
         grouped: dict[str, list[dict[str, Any]]] = defaultdict(list)
-        for event in events:
-            symbol = str(event.get("underlying_symbol") or event.get("symbol") or "UNKNOWN")
+        symbols = self._read_column_between(self.activity_path, "symbol", report_date, report_date)
+        for symbol, event in zip(symbols, events):
             grouped[symbol].append(event)
 
         if grouped:
@@ -791,26 +1469,21 @@ class ReportManager:
                 stock_events = grouped[symbol]
                 latest = stock_events[-1]
                 actions = ", ".join(
-                    f"{str(event.get('instruction') or '?')} x{int(event.get('quantity') or 0)}"
+                    f"{str(event.get('instruction') or '?')} x{_count(event.get('quantity'))}"
                     for event in stock_events
                 )
-                lines.append(f"- {symbol}: {actions}")
-                lines.append(f"  {self._reason_paragraph(latest)}")
+                lines.extend((f"- {symbol}: {actions}", f"  {self._reason_paragraph(latest)}"))
             lines.append("")
         else:
             lines.append("No buy/sell orders were recorded for this day.")
             lines.append("")
 
-        bad_calls = [
-            event
-            for event in decision_events
-            if event.get("event") == "decision_call_resolved" and event.get("outcome") == "bad_call"
-        ]
+        _, bad_calls = _split_resolved_calls(decision_events)
         if bad_calls:
             lines.append("Model postmortems (bad calls):")
             for event in bad_calls:
                 symbol = str(event.get("symbol") or "?")
-                realized = float(event.get("realized_return", 0.0) or 0.0) * 100.0
+                realized = _num(event.get("realized_return")) * 100.0
                 tags = ", ".join(str(tag) for tag in (event.get("why_bad") or []))
                 lines.append(f"- {symbol}: return {realized:+.2f}% | issues: {tags or 'n/a'}")
             lines.append("")
@@ -818,8 +1491,7 @@ class ReportManager:
         penalty_state = self._current_feature_penalties()
         if penalty_state:
             lines.append("Current cross-ticker feature penalties:")
-            for key, value in sorted(penalty_state.items()):
-                lines.append(f"- {key}: {float(value):.4f}")
+            lines.extend(f"- {key}: {float(value):.4f}" for key, value in sorted(penalty_state.items()))
 
         body = "\n".join(lines).strip() + "\n"
         return subject, body
@@ -827,28 +1499,13 @@ class ReportManager:
     def build_weekly_digest(self, end_date: date) -> tuple[str, str] | None:
         start_date = end_date - timedelta(days=6)
 
-        snapshots = [
-            event
-            for event in self._read_jsonl(self.portfolio_path)
-            if self._event_date_in_range(event, start_date, end_date)
-        ]
-        decisions = [
-            event
-            for event in self._read_jsonl(self.activity_path)
-            if self._event_date_in_range(event, start_date, end_date)
-        ]
-        journal = [
-            event
-            for event in self._read_jsonl(self.decision_journal_path)
-            if self._event_date_in_range(event, start_date, end_date)
-        ]
-        metadata_events = [
-            event
-            for event in self._read_jsonl(self.metadata_path)
-            if self._event_date_in_range(event, start_date, end_date)
-        ]
+        self._prefetch_report_logs()
+        equity_series = self._read_column_between(self.portfolio_path, "account_equity", start_date, end_date)
+        decisions = self._read_jsonl_between(self.activity_path, start_date, end_date)
+        journal = self._read_jsonl_between(self.decision_journal_path, start_date, end_date)
+        metadata_events = self._read_jsonl_between(self.metadata_path, start_date, end_date)
 
-        if not snapshots and not decisions and not journal and not metadata_events:
+        if not equity_series and not decisions and not journal and not metadata_events:
             return None
 
         prefix = self.config.report_subject_prefix.strip() or "AI Trader"
@@ -857,24 +1514,24 @@ class ReportManager:
             f"{start_date.isoformat()} to {end_date.isoformat()}"
         )
 
-        lines: list[str] = []
-        lines.append(
-            f"Weekly portfolio summary for {start_date.isoformat()} through {end_date.isoformat()} (UTC)."
-        )
-        lines.append("")
+        lines: list[str] = [
+            f"Weekly portfolio summary for {start_date.isoformat()} through {end_date.isoformat()} (UTC).",
+            "",
+        ]
 
-        if snapshots:
-            start_equity = float(snapshots[0].get("account_equity", 0.0) or 0.0)
-            end_equity = float(snapshots[-1].get("account_equity", 0.0) or 0.0)
+        if equity_series:
+            start_equity, end_equity, peak, trough, _ = _equity_stats(equity_series)
             delta = end_equity - start_equity
             pct = (delta / start_equity * 100.0) if start_equity > 0 else 0.0
-            peak = max(float(event.get("account_equity", 0.0) or 0.0) for event in snapshots)
-            trough = min(float(event.get("account_equity", 0.0) or 0.0) for event in snapshots)
 
-            lines.append(f"Start equity: ${start_equity:,.2f}")
-            lines.append(f"End equity: ${end_equity:,.2f}")
-            lines.append(f"Weekly change: {delta:+,.2f} ({pct:+.2f}%)")
-            lines.append(f"Observed range: ${trough:,.2f} to ${peak:,.2f}")
+            lines.extend(
+                (
+                    f"Start equity: ${start_equity:,.2f}",
+                    f"End equity: ${end_equity:,.2f}",
+                    f"Weekly change: {delta:+,.2f} ({pct:+.2f}%)",
+                    f"Observed range: ${trough:,.2f} to ${peak:,.2f}",
+                )
+            )
             drawdown_pct = ((peak - trough) / peak) if peak > 0 else 0.0
             goal_lines = self._goal_progress_lines(
                 report_date=end_date,
@@ -887,35 +1544,24 @@ class ReportManager:
 
         if metadata_events:
             cycle_count = len(metadata_events)
-            avg_signals = sum(int(event.get("signals_generated", 0) or 0) for event in metadata_events) / cycle_count
-            orders_emitted = sum(int(event.get("orders_proposed", 0) or 0) for event in metadata_events)
+            signals = self._read_column_between(self.metadata_path, "signals_generated", start_date, end_date)
+            orders = self._read_column_between(self.metadata_path, "orders_proposed", start_date, end_date)
+            avg_signals = sum(signals) / cycle_count
+            orders_emitted = sum(orders)
             lines.append(
                 f"System telemetry: {cycle_count} cycles, {orders_emitted} proposed orders, "
                 f"avg signals/cycle {avg_signals:.2f}."
             )
 
         if decisions:
-            by_symbol: dict[str, int] = defaultdict(int)
-            for event in decisions:
-                symbol = str(event.get("underlying_symbol") or event.get("symbol") or "UNKNOWN")
-                by_symbol[symbol] += 1
+            by_symbol = Counter(self._read_column_between(self.activity_path, "symbol", start_date, end_date))
 
             lines.append(f"Total trade decisions logged: {len(decisions)}")
             lines.append("Most active symbols:")
-            for symbol, count in sorted(by_symbol.items(), key=lambda item: item[1], reverse=True)[:8]:
-                lines.append(f"- {symbol}: {count} decisions")
+            lines.extend(f"- {symbol}: {count} decisions" for symbol, count in by_symbol.most_common(8))
             lines.append("")
 
-        resolved_bad = [
-            event
-            for event in journal
-            if event.get("event") == "decision_call_resolved" and event.get("outcome") == "bad_call"
-        ]
-        resolved_good = [
-            event
-            for event in journal
-            if event.get("event") == "decision_call_resolved" and event.get("outcome") == "good_call"
-        ]
+        resolved_good, resolved_bad = _split_resolved_calls(journal)
         if resolved_bad or resolved_good:
             lines.append(
                 "Model learning outcomes: "
@@ -929,6 +1575,11 @@ class ReportManager:
     def _clamp(value: float, low: float, high: float) -> float:
         return max(low, min(high, value))
 
+    @property
+    def _drawdown_limit(self) -> float:
+        # Read live: the control center can retune the goal while the bot runs.
+        return self._clamp(float(self.config.quarterly_goal_max_drawdown_pct), 0.0, 1.0)
+
     def _recommend_model_strengths(
         self,
         *,
@@ -948,7 +1599,7 @@ class ReportManager:
         recommended = dict(current)
         reasons = {key: "Kept stable: quarter behavior was balanced." for key in current}
 
-        drawdown_limit = self._clamp(float(self.config.quarterly_goal_max_drawdown_pct), 0.0, 1.0)
+        drawdown_limit = self._drawdown_limit
         risk_stress = (max_drawdown_pct > drawdown_limit) or (
             bad_call_rate is not None and bad_call_rate >= 0.60
         )
@@ -959,141 +1610,24 @@ class ReportManager:
         )
 
         if risk_stress:
-            recommended["historical_research_weight"] = self._clamp(
-                recommended["historical_research_weight"] - 0.03,
-                0.15,
-                0.40,
-            )
-            reasons["historical_research_weight"] = (
-                "Reduced to keep recent 7-day information more dominant during drawdown/high error periods."
-            )
-            recommended["historical_research_feedback_strength"] = self._clamp(
-                recommended["historical_research_feedback_strength"] - 0.02,
-                0.08,
-                0.20,
-            )
-            reasons["historical_research_feedback_strength"] = (
-                "Reduced to avoid overreacting to noisy short-term reversals."
-            )
-            recommended["decision_learning_rate"] = self._clamp(
-                recommended["decision_learning_rate"] - 0.02,
-                0.04,
-                0.18,
-            )
-            reasons["decision_learning_rate"] = (
-                "Reduced to slow cross-ticker penalty shifts while the regime is unstable."
-            )
-            recommended["source_priority_learning_rate"] = self._clamp(
-                recommended["source_priority_learning_rate"] - 0.02,
-                0.05,
-                0.20,
-            )
-            reasons["source_priority_learning_rate"] = (
-                "Reduced to prevent rapid source-weight swings under stressed conditions."
-            )
-            recommended["macro_model_weight"] = self._clamp(
-                recommended["macro_model_weight"] - 0.02,
-                0.05,
-                0.20,
-            )
-            reasons["macro_model_weight"] = (
-                "Reduced to limit macro-overrides when core signal quality is mixed."
-            )
-            recommended["ai_feedback_strength"] = self._clamp(
-                recommended["ai_feedback_strength"] + 0.01,
-                0.04,
-                0.20,
-            )
-            reasons["ai_feedback_strength"] = (
-                "Slightly increased so AI thesis memory adapts faster after wrong-way moves."
-            )
+            rules = [_RISK_STRESS_RULES]
         elif strong_quarter:
-            recommended["historical_research_weight"] = self._clamp(
-                recommended["historical_research_weight"] + 0.02,
-                0.15,
-                0.40,
-            )
-            reasons["historical_research_weight"] = (
-                "Increased slightly to preserve useful historical context from a stable quarter."
-            )
-            recommended["historical_research_feedback_strength"] = self._clamp(
-                recommended["historical_research_feedback_strength"] + 0.02,
-                0.08,
-                0.20,
-            )
-            reasons["historical_research_feedback_strength"] = (
-                "Increased to learn event-impact patterns a bit faster while outcomes are reliable."
-            )
-            recommended["decision_learning_rate"] = self._clamp(
-                recommended["decision_learning_rate"] + 0.01,
-                0.04,
-                0.18,
-            )
-            reasons["decision_learning_rate"] = (
-                "Increased slightly so cross-ticker lessons are applied faster."
-            )
-            recommended["source_priority_learning_rate"] = self._clamp(
-                recommended["source_priority_learning_rate"] + 0.01,
-                0.05,
-                0.20,
-            )
-            reasons["source_priority_learning_rate"] = (
-                "Increased slightly to reinforce reliable source types."
-            )
-            recommended["macro_model_weight"] = self._clamp(
-                recommended["macro_model_weight"] + 0.01,
-                0.05,
-                0.20,
-            )
-            reasons["macro_model_weight"] = (
-                "Increased modestly since macro integration behaved well this quarter."
-            )
+            rules = [_STRONG_QUARTER_RULES]
         else:
+            rules = []
             if no_trade_ratio is not None and no_trade_ratio > 0.80:
-                recommended["macro_model_weight"] = self._clamp(
-                    recommended["macro_model_weight"] + 0.01,
-                    0.05,
-                    0.20,
-                )
-                reasons["macro_model_weight"] = (
-                    "Increased slightly to help break ties when too many trade-capable cycles produce no action."
-                )
-                recommended["decision_learning_rate"] = self._clamp(
-                    recommended["decision_learning_rate"] + 0.01,
-                    0.04,
-                    0.18,
-                )
-                reasons["decision_learning_rate"] = (
-                    "Increased slightly to speed adaptation in a low-activity quarter."
-                )
+                rules.append(_LOW_ACTIVITY_RULES)
             if bad_call_rate is not None and bad_call_rate > 0.50:
-                recommended["historical_research_feedback_strength"] = self._clamp(
-                    recommended["historical_research_feedback_strength"] - 0.01,
-                    0.08,
-                    0.20,
-                )
-                reasons["historical_research_feedback_strength"] = (
-                    "Reduced slightly to avoid overfitting pattern feedback in mixed conditions."
-                )
-                recommended["source_priority_learning_rate"] = self._clamp(
-                    recommended["source_priority_learning_rate"] - 0.01,
-                    0.05,
-                    0.20,
-                )
-                reasons["source_priority_learning_rate"] = (
-                    "Reduced slightly until source-quality alignment improves."
-                )
+                rules.append(_HIGH_ERROR_RULES)
+
+        for rule_set in rules:
+            for key, delta, reason in rule_set:
+                low, high = _STRENGTH_BOUNDS[key]
+                recommended[key] = max(low, min(high, recommended[key] + delta))
+                reasons[key] = reason
 
-        order = [
-            ("historical_research_weight", "Historical Research Weight"),
-            ("historical_research_feedback_strength", "Historical Pattern Feedback Strength"),
-            ("decision_learning_rate", "Decision Learning Rate"),
-            ("source_priority_learning_rate", "Source Priority Learning Rate"),
-            ("macro_model_weight", "Macro Model Weight"),
-            ("ai_feedback_strength", "AI Feedback Strength"),
-        ]
         rows: list[dict[str, Any]] = []
-        for key, label in order:
+        for key, label in _STRENGTH_LABELS:
             current_value = round(float(current[key]), 3)
             recommended_value = round(float(recommended[key]), 3)
             rows.append(
@@ -1114,96 +1648,74 @@ class ReportManager:
         evaluation_start: date,
         evaluation_end: date,
     ) -> dict[str, Any] | None:
-        snapshots = [
-            event
-            for event in self._read_jsonl(self.portfolio_path)
-            if self._event_date_in_range(event, evaluation_start, evaluation_end)
-        ]
-        decisions = [
-            event
-            for event in self._read_jsonl(self.activity_path)
-            if self._event_date_in_range(event, evaluation_start, evaluation_end)
-        ]
-        journal = [
-            event
-            for event in self._read_jsonl(self.decision_journal_path)
-            if self._event_date_in_range(event, evaluation_start, evaluation_end)
-        ]
-        metadata_events = [
-            event
-            for event in self._read_jsonl(self.metadata_path)
-            if self._event_date_in_range(event, evaluation_start, evaluation_end)
-        ]
-
-        if not snapshots and not journal and not metadata_events:
+        if self._fresh_paths is None:
+            return self._compute_quarter_window(evaluation_start, evaluation_end)
+        key = (evaluation_start, evaluation_end)
+        if key not in self._quarter_metrics_memo:
+            self._quarter_metrics_memo[key] = self._compute_quarter_window(evaluation_start, evaluation_end)
+        return self._quarter_metrics_memo[key]
+
+    def _compute_quarter_window(self, evaluation_start: date, evaluation_end: date) -> dict[str, Any] | None:
+        self._prefetch_report_logs()
+        equity_series = self._read_column_between(self.portfolio_path, "account_equity", evaluation_start, evaluation_end)
+        # Only the number of trade decisions is reported, so count index hits without copying rows.
+        _, decision_indices = self._row_indices_between(self.activity_path, evaluation_start, evaluation_end)
+        journal = self._read_jsonl_between(self.decision_journal_path, evaluation_start, evaluation_end)
+        metadata_events = self._read_jsonl_between(self.metadata_path, evaluation_start, evaluation_end)
+
+        if not equity_series and not journal and not metadata_events:
             return None
 
-        if snapshots:
-            equity_series = [float(event.get("account_equity", 0.0) or 0.0) for event in snapshots]
-            start_equity = equity_series[0]
-            end_equity = equity_series[-1]
-            running_peak = equity_series[0]
-            max_drawdown = 0.0
-            for value in equity_series:
-                running_peak = max(running_peak, value)
-                if running_peak > 0:
-                    max_drawdown = max(max_drawdown, (running_peak - value) / running_peak)
+        if equity_series:
+            start_equity, end_equity, _, _, max_drawdown = _equity_stats(equity_series)
         else:
             start_equity = float(self.config.quarterly_goal_start_equity)
             end_equity = start_equity
             max_drawdown = 0.0
         quarter_return_pct = ((end_equity / start_equity) - 1.0) if start_equity > 0 else 0.0
 
-        resolved = [
-            event
-            for event in journal
-            if event.get("event") == "decision_call_resolved"
-            and str(event.get("outcome") or "") in {"good_call", "bad_call"}
-        ]
-        good_calls = sum(1 for event in resolved if event.get("outcome") == "good_call")
-        bad_calls = [event for event in resolved if event.get("outcome") == "bad_call"]
-        bad_call_rate = (len(bad_calls) / len(resolved)) if resolved else None
-
-        tag_counts: dict[str, int] = defaultdict(int)
-        for event in bad_calls:
-            tags = event.get("why_bad")
-            if not isinstance(tags, list):
-                continue
-            for tag in tags:
-                text = str(tag).strip()
-                if text:
-                    tag_counts[text] += 1
-
-        trade_cycles = [event for event in metadata_events if bool(event.get("execute_orders", False))]
-        no_trade_cycles = sum(1 for event in trade_cycles if int(event.get("orders_proposed", 0) or 0) == 0)
-        no_trade_ratio = (no_trade_cycles / len(trade_cycles)) if trade_cycles else None
-
-        source_counts: dict[str, int] = defaultdict(int)
-        for event in metadata_events:
-            by_source = event.get("research_items_by_source")
-            if not isinstance(by_source, dict):
+        # One pass tallies resolved calls and bad-call tags without keeping the events.
+        good_calls = 0
+        bad_calls = 0
+        tag_counts: Counter[str] = Counter()
+        for event in journal:
+            if event.get("event") != EVENT_CALL_RESOLVED:
                 continue
-            for key, value in by_source.items():
-                if isinstance(value, (int, float)):
-                    source_counts[str(key)] += int(value)
+            outcome = event.get("outcome")
+            if outcome == "good_call":
+                good_calls += 1
+            elif outcome == "bad_call":
+                bad_calls += 1
+                tags = event.get("why_bad")
+                if isinstance(tags, list):
+                    tag_counts.update(filter(None, (str(tag).strip() for tag in tags)))
+        resolved_calls = good_calls + bad_calls
+        bad_call_rate = (bad_calls / resolved_calls) if resolved_calls else None
+
+        execute = self._read_column_between(self.metadata_path, "execute_orders", evaluation_start, evaluation_end)
+        orders = self._read_column_between(self.metadata_path, "orders_proposed", evaluation_start, evaluation_end)
+        trade_cycles = 0
+        no_trade_cycles = 0
+        for executed, count in zip(execute, orders):
+            if executed:
+                trade_cycles += 1
+                if count == 0:
+                    no_trade_cycles += 1
+        no_trade_ratio = (no_trade_cycles / trade_cycles) if trade_cycles else None
+
+        source_counts = _research_source_counts(metadata_events)
         source_total = sum(source_counts.values())
-        source_concentration = (max(source_counts.values()) / source_total) if source_total > 0 else 0.0
+        source_concentration = (max(source_counts.values(), default=0) / source_total) if source_total > 0 else 0.0
 
-        latest_source_bias = (
-            metadata_events[-1].get("source_bias")
-            if metadata_events and isinstance(metadata_events[-1], dict)
-            else {}
-        )
+        # Cached log rows are always dicts.
+        latest_source_bias = metadata_events[-1].get("source_bias") if metadata_events else {}
         source_bias_strength = 0.0
         if isinstance(latest_source_bias, dict):
-            source_bias_strength = max(
-                (
-                    abs(float(value))
-                    for value in latest_source_bias.values()
-                    if isinstance(value, (int, float))
-                ),
-                default=0.0,
-            )
+            for value in latest_source_bias.values():
+                if isinstance(value, (int, float)):
+                    magnitude = -value if value < 0 else value
+                    if magnitude > source_bias_strength:
+                        source_bias_strength = float(magnitude)
 
         return {
             "evaluation_start": evaluation_start.isoformat(),
@@ -1212,12 +1724,12 @@ class ReportManager:
             "end_equity": end_equity,
             "quarter_return_pct": quarter_return_pct,
             "max_drawdown_pct": max_drawdown,
-            "decisions_logged": len(decisions),
-            "resolved_calls": len(resolved),
+            "decisions_logged": len(decision_indices),
+            "resolved_calls": resolved_calls,
             "good_calls": good_calls,
-            "bad_calls": len(bad_calls),
+            "bad_calls": bad_calls,
             "bad_call_rate": bad_call_rate,
-            "trade_cycles": len(trade_cycles),
+            "trade_cycles": trade_cycles,
             "no_trade_cycles": no_trade_cycles,
             "no_trade_ratio": no_trade_ratio,
             "source_concentration": source_concentration,
@@ -1229,11 +1741,11 @@ class ReportManager:
     @staticmethod
     def _metric_delta(current: float, previous: Any) -> float:
         previous_value = float(previous) if isinstance(previous, (int, float)) else 0.0
-        return round(current - previous_value, 4)
+        return current - previous_value
 
     def build_quarterly_model_advisor_payload(self, next_quarter_start: date) -> dict[str, Any] | None:
         evaluation_end = next_quarter_start - timedelta(days=1)
-        evaluation_start = self._quarter_start_for(evaluation_end)
+        evaluation_start = _quarter_start_for(evaluation_end)
         metrics = self._evaluate_quarter_window(
             evaluation_start=evaluation_start,
             evaluation_end=evaluation_end,
@@ -1241,18 +1753,19 @@ class ReportManager:
         if metrics is None:
             return None
 
+        quarter_return_pct = float(metrics["quarter_return_pct"])
+        max_drawdown_pct = float(metrics["max_drawdown_pct"])
+        bad_call_rate = _optional_float(metrics["bad_call_rate"])
+        no_trade_ratio = _optional_float(metrics["no_trade_ratio"])
+
         recommendations = self._recommend_model_strengths(
-            quarter_return_pct=float(metrics["quarter_return_pct"]),
-            max_drawdown_pct=float(metrics["max_drawdown_pct"]),
-            bad_call_rate=(
-                float(metrics["bad_call_rate"]) if isinstance(metrics["bad_call_rate"], (int, float)) else None
-            ),
-            no_trade_ratio=(
-                float(metrics["no_trade_ratio"]) if isinstance(metrics["no_trade_ratio"], (int, float)) else None
-            ),
+            quarter_return_pct=quarter_return_pct,
+            max_drawdown_pct=max_drawdown_pct,
+            bad_call_rate=bad_call_rate,
+            no_trade_ratio=no_trade_ratio,
         )
 
-        previous = self._latest_report_event(self.quarterly_advisor_path, "quarterly_model_advisor")
+        previous = self._latest_report_event(self.quarterly_advisor_path, EVENT_QUARTERLY_ADVISOR)
         previous_metrics = (
             previous.get("metrics")
             if isinstance(previous, dict) and isinstance(previous.get("metrics"), dict)
@@ -1260,19 +1773,19 @@ class ReportManager:
         )
         comparison = {
             "quarter_return_pct_delta": self._metric_delta(
-                float(metrics["quarter_return_pct"]),
+                quarter_return_pct,
                 previous_metrics.get("quarter_return_pct"),
             ),
             "max_drawdown_pct_delta": self._metric_delta(
-                float(metrics["max_drawdown_pct"]),
+                max_drawdown_pct,
                 previous_metrics.get("max_drawdown_pct"),
             ),
             "bad_call_rate_delta": self._metric_delta(
-                float(metrics["bad_call_rate"]) if isinstance(metrics["bad_call_rate"], (int, float)) else 0.0,
+                bad_call_rate if bad_call_rate is not None else 0.0,
                 previous_metrics.get("bad_call_rate"),
             ),
             "no_trade_ratio_delta": self._metric_delta(
-                float(metrics["no_trade_ratio"]) if isinstance(metrics["no_trade_ratio"], (int, float)) else 0.0,
+                no_trade_ratio if no_trade_ratio is not None else 0.0,
                 previous_metrics.get("no_trade_ratio"),
             ),
         }
@@ -1284,51 +1797,41 @@ class ReportManager:
             f"{next_quarter_start.year}"
         )
 
-        lines: list[str] = []
-        lines.append(
-            f"Quarterly model-strength recommendation for next quarter start {next_quarter_start.isoformat()}."
-        )
-        lines.append(
-            f"Evaluation window: {metrics['evaluation_start']} through {metrics['evaluation_end']} (report timezone)."
-        )
-        lines.append("")
-        lines.append("Quarter performance summary:")
-        lines.append(
-            f"- Equity: ${float(metrics['start_equity']):,.2f} -> ${float(metrics['end_equity']):,.2f} "
-            f"({float(metrics['quarter_return_pct']) * 100:+.2f}%)"
-        )
-        lines.append(f"- Max drawdown observed: {float(metrics['max_drawdown_pct']) * 100:.2f}%")
-        lines.append(f"- Decisions logged: {int(metrics['decisions_logged'])}")
-        lines.append(
-            f"- Resolved calls: {int(metrics['resolved_calls'])} "
-            f"(good={int(metrics['good_calls'])}, bad={int(metrics['bad_calls'])}"
-            + (
-                f", bad rate={float(metrics['bad_call_rate']) * 100:.1f}%"
-                if isinstance(metrics["bad_call_rate"], (int, float))
-                else ""
-            )
-            + ")"
+        summary = _QUARTERLY_ADVISOR_SUMMARY.format_map(
+            {
+                "next_quarter_start": next_quarter_start.isoformat(),
+                "evaluation_start": metrics["evaluation_start"],
+                "evaluation_end": metrics["evaluation_end"],
+                "start_equity": float(metrics["start_equity"]),
+                "end_equity": float(metrics["end_equity"]),
+                "return_pct": quarter_return_pct * 100,
+                "drawdown_pct": max_drawdown_pct * 100,
+                "decisions_logged": int(metrics["decisions_logged"]),
+                "resolved_calls": int(metrics["resolved_calls"]),
+                "good_calls": int(metrics["good_calls"]),
+                "bad_calls": int(metrics["bad_calls"]),
+                "bad_rate_text": (
+                    f", bad rate={bad_call_rate * 100:.1f}%" if bad_call_rate is not None else ""
+                ),
+            }
         )
-        if isinstance(metrics["no_trade_ratio"], (int, float)):
+        lines: list[str] = [summary]
+        if no_trade_ratio is not None:
             lines.append(
-                f"- Trade-capable cycles with no orders: {int(metrics['no_trade_cycles'])}/{int(metrics['trade_cycles'])} "
-                f"({float(metrics['no_trade_ratio']) * 100:.1f}%)"
+                _NO_ORDER_CYCLES_LINE(
+                    int(metrics["no_trade_cycles"]),
+                    int(metrics["trade_cycles"]),
+                    no_trade_ratio * 100,
+                )
             )
         lines.append("")
-        lines.append("Results vs previous quarterly review:")
-        lines.append(
-            f"- Return delta: {comparison['quarter_return_pct_delta']:+.4f}, "
-            f"drawdown delta: {comparison['max_drawdown_pct_delta']:+.4f}, "
-            f"bad-call delta: {comparison['bad_call_rate_delta']:+.4f}, "
-            f"no-trade delta: {comparison['no_trade_ratio_delta']:+.4f}"
-        )
+        lines.append(_QUARTERLY_ADVISOR_COMPARISON.format_map(comparison))
         lines.append("")
         lines.append("Recommended model-strength changes:")
         for row in recommendations:
             marker = "CHANGE" if bool(row.get("changed")) else "KEEP"
             lines.append(
-                f"- [{marker}] {row['label']}: {float(row['current']):.3f} -> {float(row['recommended']):.3f}. "
-                f"{row['reason']}"
+                _STRENGTH_ROW_LINE(marker, row["label"], float(row["current"]), float(row["recommended"]), row["reason"])
             )
         lines.append("")
         lines.append(
@@ -1362,69 +1865,24 @@ class ReportManager:
         source_concentration: float,
         source_bias_strength: float,
     ) -> list[dict[str, Any]]:
-        ideas: dict[str, dict[str, Any]] = {
-            "regime_risk_model": {
-                "label": "Regime Risk Model",
-                "score": 0.0,
-                "reasons": [],
-                "effort": "Medium",
-                "estimate": "2-3 weeks",
-                "build": (
-                    "Build a market-regime classifier (risk-on/risk-off/high-vol) that gates position sizing "
-                    "and reduces entries during unstable regimes."
-                ),
-            },
-            "event_impact_horizon_model": {
-                "label": "Event Impact Horizon Model",
-                "score": 0.0,
-                "reasons": [],
-                "effort": "High",
-                "estimate": "3-5 weeks",
-                "build": (
-                    "Build an event-impact model that maps filing/news/policy event types to expected "
-                    "price impact direction and time horizon."
-                ),
-            },
-            "source_reliability_forecaster": {
-                "label": "Source Reliability Forecaster",
-                "score": 0.0,
-                "reasons": [],
-                "effort": "Medium",
-                "estimate": "2-4 weeks",
-                "build": (
-                    "Build a source-quality forecaster that predicts which source types are likely to be "
-                    "reliable by regime and ticker cluster."
-                ),
-            },
-            "opportunity_ranking_model": {
-                "label": "Opportunity Ranking Model",
-                "score": 0.0,
-                "reasons": [],
-                "effort": "Low",
-                "estimate": "1-2 weeks",
-                "build": (
-                    "Build an opportunity-ranking model that improves trade selection when many names are close "
-                    "in score, reducing no-trade cycles."
-                ),
-            },
-        }
+        scores = dict.fromkeys(_MODEL_IDEAS, 0.0)
+        reasons: dict[str, list[str]] = {key: [] for key in _MODEL_IDEAS}
 
-        drawdown_limit = self._clamp(float(self.config.quarterly_goal_max_drawdown_pct), 0.0, 1.0)
+        def add(key: str, score: float, reason: str) -> None:
+            scores[key] += score
+            reasons[key].append(reason)
+
+        drawdown_limit = self._drawdown_limit
         if max_drawdown_pct > drawdown_limit:
-            ideas["regime_risk_model"]["score"] += 3.0
-            ideas["regime_risk_model"]["reasons"].append(
-                f"Quarter drawdown {max_drawdown_pct * 100:.2f}% exceeded limit {drawdown_limit * 100:.2f}%."
+            add(
+                "regime_risk_model",
+                3.0,
+                f"Quarter drawdown {max_drawdown_pct * 100:.2f}% exceeded limit {drawdown_limit * 100:.2f}%.",
             )
         if tag_counts.get("high_volatility_regime", 0) > 0:
-            ideas["regime_risk_model"]["score"] += 2.0
-            ideas["regime_risk_model"]["reasons"].append(
-                "Bad-call postmortems flagged high volatility regime conditions."
-            )
+            add("regime_risk_model", 2.0, "Bad-call postmortems flagged high volatility regime conditions.")
         if bad_call_rate is not None and bad_call_rate >= 0.55:
-            ideas["regime_risk_model"]["score"] += 1.0
-            ideas["regime_risk_model"]["reasons"].append(
-                f"Bad-call rate was elevated at {bad_call_rate * 100:.1f}%."
-            )
+            add("regime_risk_model", 1.0, f"Bad-call rate was elevated at {bad_call_rate * 100:.1f}%.")
 
         event_miss_count = (
             tag_counts.get("news_overreaction", 0)
@@ -1432,74 +1890,72 @@ class ReportManager:
             + tag_counts.get("macro_policy_miss", 0)
         )
         if event_miss_count > 0:
-            ideas["event_impact_horizon_model"]["score"] += min(4.0, float(event_miss_count))
-            ideas["event_impact_horizon_model"]["reasons"].append(
+            add(
+                "event_impact_horizon_model",
+                min(4.0, float(event_miss_count)),
                 f"Postmortems show {event_miss_count} event-interpretation misses "
-                "(news/AI/macro timing or direction)."
+                "(news/AI/macro timing or direction).",
             )
         if quarter_return_pct < 0:
-            ideas["event_impact_horizon_model"]["score"] += 1.0
-            ideas["event_impact_horizon_model"]["reasons"].append(
-                "Quarter return was negative, suggesting event impact timing needs improvement."
+            add(
+                "event_impact_horizon_model",
+                1.0,
+                "Quarter return was negative, suggesting event impact timing needs improvement.",
             )
 
         if source_concentration > 0.55:
-            ideas["source_reliability_forecaster"]["score"] += 2.0
-            ideas["source_reliability_forecaster"]["reasons"].append(
-                f"Research intake was concentrated ({source_concentration * 100:.1f}% from top source type)."
+            add(
+                "source_reliability_forecaster",
+                2.0,
+                f"Research intake was concentrated ({source_concentration * 100:.1f}% from top source type).",
             )
         if source_bias_strength > 0.25:
-            ideas["source_reliability_forecaster"]["score"] += 2.0
-            ideas["source_reliability_forecaster"]["reasons"].append(
-                f"Source-bias dispersion reached {source_bias_strength:.3f}, indicating regime-dependent reliability."
+            add(
+                "source_reliability_forecaster",
+                2.0,
+                f"Source-bias dispersion reached {source_bias_strength:.3f}, indicating regime-dependent reliability.",
             )
 
         if no_trade_ratio is not None and no_trade_ratio > 0.75:
-            ideas["opportunity_ranking_model"]["score"] += 3.0
-            ideas["opportunity_ranking_model"]["reasons"].append(
-                f"Trade-capable cycles had no orders {no_trade_ratio * 100:.1f}% of the time."
+            add(
+                "opportunity_ranking_model",
+                3.0,
+                f"Trade-capable cycles had no orders {no_trade_ratio * 100:.1f}% of the time.",
             )
         if tag_counts.get("momentum_reversal", 0) > 0:
-            ideas["opportunity_ranking_model"]["score"] += 1.0
-            ideas["opportunity_ranking_model"]["reasons"].append(
-                "Momentum reversals appeared in bad-call diagnostics."
-            )
+            add("opportunity_ranking_model", 1.0, "Momentum reversals appeared in bad-call diagnostics.")
 
-        ranked = sorted(
-            ideas.values(),
-            key=lambda row: float(row["score"]),
-            reverse=True,
-        )
-        selected = [row for row in ranked if float(row["score"]) > 0.0][:3]
+        ranked = heapq.nlargest(3, _MODEL_IDEAS, key=scores.__getitem__)
+        selected = [key for key in ranked if scores[key] > 0.0]
         if not selected:
             selected = ranked[:2]
-            for row in selected:
-                if not row["reasons"]:
-                    row["reasons"].append(
-                        "Baseline recommendation: add targeted model diversity before next quarter."
-                    )
+            for key in selected:
+                if not reasons[key]:
+                    reasons[key].append("Baseline recommendation: add targeted model diversity before next quarter.")
 
         recommendations: list[dict[str, Any]] = []
-        for row in selected:
+        for key in selected:
+            idea = _MODEL_IDEAS[key]
             recommendations.append(
                 {
-                    "label": row["label"],
-                    "score": round(float(row["score"]), 2),
-                    "effort": row["effort"],
-                    "estimate": row["estimate"],
-                    "why": " ".join(str(reason) for reason in row["reasons"]),
-                    "build": row["build"],
+                    "label": idea["label"],
+                    "score": round(scores[key], 2),
+                    "effort": idea["effort"],
+                    "estimate": idea["estimate"],
+                    "why": " ".join(reasons[key]),
+                    "build": idea["build"],
                 }
             )
         return recommendations
 
     def build_model_roadmap_advisor_payload(self, next_quarter_start: date) -> dict[str, Any] | None:
-        target_quarter = self._quarter_index(next_quarter_start)
-        if target_quarter not in self.config.model_roadmap_target_quarters:
+        config = self.config
+        target_quarter = _quarter_index(next_quarter_start)
+        if target_quarter not in config.model_roadmap_target_quarters:
             return None
 
         evaluation_end = next_quarter_start - timedelta(days=1)
-        evaluation_start = self._quarter_start_for(evaluation_end)
+        evaluation_start = _quarter_start_for(evaluation_end)
         metrics = self._evaluate_quarter_window(
             evaluation_start=evaluation_start,
             evaluation_end=evaluation_end,
@@ -1507,21 +1963,24 @@ class ReportManager:
         if metrics is None:
             return None
 
+        quarter_return_pct = float(metrics["quarter_return_pct"])
+        max_drawdown_pct = float(metrics["max_drawdown_pct"])
+        bad_call_rate = _optional_float(metrics["bad_call_rate"])
+        no_trade_ratio = _optional_float(metrics["no_trade_ratio"])
+        source_concentration = float(metrics["source_concentration"])
+        source_total_items = int(metrics["source_total_items"])
+
         recommendations = self._recommend_new_models(
-            quarter_return_pct=float(metrics["quarter_return_pct"]),
-            max_drawdown_pct=float(metrics["max_drawdown_pct"]),
-            bad_call_rate=(
-                float(metrics["bad_call_rate"]) if isinstance(metrics["bad_call_rate"], (int, float)) else None
-            ),
-            no_trade_ratio=(
-                float(metrics["no_trade_ratio"]) if isinstance(metrics["no_trade_ratio"], (int, float)) else None
-            ),
+            quarter_return_pct=quarter_return_pct,
+            max_drawdown_pct=max_drawdown_pct,
+            bad_call_rate=bad_call_rate,
+            no_trade_ratio=no_trade_ratio,
             tag_counts=dict(metrics["tag_counts"]),
-            source_concentration=float(metrics["source_concentration"]),
+            source_concentration=source_concentration,
             source_bias_strength=float(metrics["source_bias_strength"]),
         )
 
-        previous = self._latest_report_event(self.model_roadmap_path, "model_roadmap_advisor")
+        previous = self._latest_report_event(self.model_roadmap_path, EVENT_MODEL_ROADMAP)
         previous_metrics = (
             previous.get("metrics")
             if isinstance(previous, dict) and isinstance(previous.get("metrics"), dict)
@@ -1532,86 +1991,73 @@ class ReportManager:
             if isinstance(previous, dict) and isinstance(previous.get("recommendations"), list)
             else []
         )
-        previous_top_priority = 0.0
-        if previous_recommendations:
-            first = previous_recommendations[0]
-            if isinstance(first, dict) and isinstance(first.get("score"), (int, float)):
-                previous_top_priority = float(first.get("score"))
-        current_top_priority = float(recommendations[0]["score"]) if recommendations else 0.0
+        first = previous_recommendations[0] if previous_recommendations else None
+        previous_top_priority = first.get("score") if isinstance(first, dict) else None
+        # _recommend_new_models already returns scores as rounded floats.
+        current_top_priority = recommendations[0]["score"] if recommendations else 0.0
         comparison = {
             "quarter_return_pct_delta": self._metric_delta(
-                float(metrics["quarter_return_pct"]),
+                quarter_return_pct,
                 previous_metrics.get("quarter_return_pct"),
             ),
             "max_drawdown_pct_delta": self._metric_delta(
-                float(metrics["max_drawdown_pct"]),
+                max_drawdown_pct,
                 previous_metrics.get("max_drawdown_pct"),
             ),
             "source_concentration_delta": self._metric_delta(
-                float(metrics["source_concentration"]),
+                source_concentration,
                 previous_metrics.get("source_concentration"),
             ),
-            "top_priority_score_delta": round(current_top_priority - previous_top_priority, 4),
+            "top_priority_score_delta": self._metric_delta(current_top_priority, previous_top_priority),
         }
 
-        prefix = self.config.report_subject_prefix.strip() or "AI Trader"
+        prefix = config.report_subject_prefix.strip() or "AI Trader"
         subject = (
             f"[{prefix}] Model Roadmap Advisor - Prep for Q{target_quarter} "
             f"{next_quarter_start.year}"
         )
 
-        lines: list[str] = []
-        lines.append(
-            f"Model roadmap recommendation for next quarter start {next_quarter_start.isoformat()}."
-        )
-        lines.append(
-            f"This advisor runs for Q1/Q3 and is sent {self.config.model_roadmap_reminder_days} days before quarter start."
-        )
-        lines.append(
-            f"Evaluation window: {metrics['evaluation_start']} through {metrics['evaluation_end']} (report timezone)."
-        )
-        lines.append("")
-        lines.append("Learning summary from this quarter:")
-        lines.append(
-            f"- Equity: ${float(metrics['start_equity']):,.2f} -> ${float(metrics['end_equity']):,.2f} "
-            f"({float(metrics['quarter_return_pct']) * 100:+.2f}%)"
-        )
-        lines.append(f"- Max drawdown: {float(metrics['max_drawdown_pct']) * 100:.2f}%")
-        lines.append(f"- Decisions logged: {int(metrics['decisions_logged'])}")
-        lines.append(
-            f"- Resolved calls: {int(metrics['resolved_calls'])}"
-            + (
-                f", bad-call rate {float(metrics['bad_call_rate']) * 100:.1f}%"
-                if isinstance(metrics["bad_call_rate"], (int, float))
-                else ""
-            )
+        summary = _MODEL_ROADMAP_SUMMARY.format_map(
+            {
+                "next_quarter_start": next_quarter_start.isoformat(),
+                "reminder_days": config.model_roadmap_reminder_days,
+                "evaluation_start": metrics["evaluation_start"],
+                "evaluation_end": metrics["evaluation_end"],
+                "start_equity": float(metrics["start_equity"]),
+                "end_equity": float(metrics["end_equity"]),
+                "return_pct": quarter_return_pct * 100,
+                "drawdown_pct": max_drawdown_pct * 100,
+                "decisions_logged": int(metrics["decisions_logged"]),
+                "resolved_calls": int(metrics["resolved_calls"]),
+                "bad_rate_text": (
+                    f", bad-call rate {bad_call_rate * 100:.1f}%" if bad_call_rate is not None else ""
+                ),
+            }
         )
-        if isinstance(metrics["no_trade_ratio"], (int, float)):
+        lines: list[str] = [summary]
+        if no_trade_ratio is not None:
             lines.append(
-                f"- Trade-capable no-order ratio: {int(metrics['no_trade_cycles'])}/{int(metrics['trade_cycles'])} "
-                f"({float(metrics['no_trade_ratio']) * 100:.1f}%)"
+                _NO_ORDER_RATIO_LINE(
+                    int(metrics["no_trade_cycles"]),
+                    int(metrics["trade_cycles"]),
+                    no_trade_ratio * 100,
+                )
             )
-        if int(metrics["source_total_items"]) > 0:
+        if source_total_items > 0:
             lines.append(
-                f"- Source concentration: {float(metrics['source_concentration']) * 100:.1f}% from top source type "
-                f"across {int(metrics['source_total_items'])} research items."
+                _SOURCE_CONCENTRATION_LINE(
+                    source_concentration * 100,
+                    source_total_items,
+                )
             )
         lines.append("")
-        lines.append("Results vs previous roadmap review:")
-        lines.append(
-            f"- Return delta: {comparison['quarter_return_pct_delta']:+.4f}, "
-            f"drawdown delta: {comparison['max_drawdown_pct_delta']:+.4f}, "
-            f"source concentration delta: {comparison['source_concentration_delta']:+.4f}, "
-            f"top-priority score delta: {comparison['top_priority_score_delta']:+.4f}"
-        )
+        lines.append(_MODEL_ROADMAP_COMPARISON.format_map(comparison))
         lines.append("")
         lines.append("Recommended new models to build (with estimated implementation effort):")
         for row in recommendations:
             lines.append(
-                f"- {row['label']} (priority {float(row['score']):.2f}, effort {row['effort']}, "
-                f"estimate {row['estimate']}): {row['why']}"
+                _MODEL_IDEA_LINES(row["label"], row["score"], row["effort"], row["estimate"], row["why"], row["build"])
             )
-            lines.append(f"  Build recommendation: {row['build']}")
         lines.append("")
         lines.append(
             "Action: review these alongside the quarterly strength-adjustment report; if both arrive in the same run, apply both sets together."
@@ -1633,28 +2079,28 @@ class ReportManager:
         return str(payload["subject"]), str(payload["body"])
 
     def _goal_progress_lines(self, *, report_date: date, end_equity: float, drawdown_pct: float) -> list[str]:
-        if not self.config.enable_quarterly_goal_tracking:
+        config = self.config
+        if not config.enable_quarterly_goal_tracking:
             return []
 
-        try:
-            start_day = date.fromisoformat(self.config.quarterly_goal_start_date)
-            end_day = date.fromisoformat(self.config.quarterly_goal_end_date)
-        except ValueError:
+        window = _goal_window(config.quarterly_goal_start_date, config.quarterly_goal_end_date)
+        if window is None:
             return []
+        start_day, end_day = window
 
         if report_date < start_day or report_date > end_day:
             return []
 
-        start_equity = max(1.0, float(self.config.quarterly_goal_start_equity))
-        target_equity = max(1.0, float(self.config.quarterly_goal_target_equity))
+        start_equity = max(1.0, float(config.quarterly_goal_start_equity))
+        target_equity = max(1.0, float(config.quarterly_goal_target_equity))
         gain_needed = target_equity - start_equity
         progress_ratio = 1.0 if gain_needed <= 0 else (end_equity - start_equity) / gain_needed
         progress_ratio = max(0.0, min(progress_ratio, 2.0))
-        max_drawdown = max(0.0, min(float(self.config.quarterly_goal_max_drawdown_pct), 1.0))
+        max_drawdown = self._drawdown_limit
         drawdown_limit_hit = drawdown_pct > max_drawdown if max_drawdown > 0 else False
 
         lines = [
-            f"Quarter goal ({self.config.quarterly_goal_label}): "
+            f"Quarter goal ({config.quarterly_goal_label}): "
             f"${start_equity:,.2f} -> ${target_equity:,.2f}.",
             f"Goal progress: ${end_equity:,.2f} ({progress_ratio * 100:.1f}% of planned move).",
             (
@@ -1671,17 +2117,17 @@ class ReportManager:
         instruction = str(event.get("instruction") or "").upper()
         symbol = str(event.get("underlying_symbol") or event.get("symbol") or "this stock")
 
-        score = float(signal.get("score", 0.0) or 0.0)
-        momentum_20d = float(signal.get("momentum_20d", 0.0) or 0.0)
-        momentum_5d = float(signal.get("momentum_5d", 0.0) or 0.0)
-        trend_20d = float(signal.get("trend_20d", 0.0) or 0.0)
-        news_score = float(signal.get("news_score", 0.0) or 0.0)
-        current_news_score = float(signal.get("current_news_score", news_score) or news_score)
-        historical_news_score = float(signal.get("historical_news_score", news_score) or news_score)
-        macro_score = float(signal.get("macro_score", 0.0) or 0.0)
-        ai_short = float(signal.get("ai_short_term_score", 0.0) or 0.0)
-        ai_long = float(signal.get("ai_long_term_score", 0.0) or 0.0)
-        volatility = float(signal.get("volatility_20d", 0.0) or 0.0)
+        score = _num(signal.get("score"))
+        momentum_20d = _num(signal.get("momentum_20d"))
+        momentum_5d = _num(signal.get("momentum_5d"))
+        trend_20d = _num(signal.get("trend_20d"))
+        news_score = _num(signal.get("news_score"))
+        current_news_score = _num(signal.get("current_news_score"), news_score)
+        historical_news_score = _num(signal.get("historical_news_score"), news_score)
+        macro_score = _num(signal.get("macro_score"))
+        ai_short = _num(signal.get("ai_short_term_score"))
+        ai_long = _num(signal.get("ai_long_term_score"))
+        volatility = _num(signal.get("volatility_20d"))
 
         base = (
             f"{symbol} had 20d momentum {momentum_20d:+.2%}, 5d momentum {momentum_5d:+.2%}, "
@@ -1703,54 +2149,202 @@ class ReportManager:
         return f"Decision score at execution was {score:+.4f}. {base}"
 
     def _current_feature_penalties(self) -> dict[str, float]:
+        """Return the learned feature penalties, re-read only when the state file changes.
+
+        The returned dict is shared with the cache and must not be mutated.
+        """
         path = Path(self.config.decision_learning_state_path)
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except OSError:
+            self._feature_penalties_cache = None
             return {}
 
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        cached = self._feature_penalties_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload = _json_loads(path.read_bytes())
         except Exception:
             return {}
 
         penalties = payload.get("feature_penalties")
-        if not isinstance(penalties, dict):
-            return {}
-
-        clean: dict[str, float] = {}
-        for key, value in penalties.items():
-            if isinstance(value, (int, float)):
-                clean[str(key)] = float(value)
+        clean: dict[str, float] = (
+            {str(name): float(value) for name, value in penalties.items() if isinstance(value, (int, float))}
+            if isinstance(penalties, dict)
+            else {}
+        )
+        self._feature_penalties_cache = (key, clean)
         return clean
 
     def _event_date(self, event: dict[str, Any]) -> date | None:
-        ts = self._parse_ts(str(event.get("timestamp") or ""))
+        raw = event.get("timestamp")
+        text = raw if isinstance(raw, str) else str(raw or "")
+
+        # Fast path: our logs store UTC isoformat() strings, and consecutive
+        # rows usually share a report day, so compare the seconds prefix
+        # against that day's cached UTC bounds instead of parsing.
+        window = self._event_day_window
+        if window is not None and len(text) >= 25 and text[10] == "T" and text.endswith("+00:00"):
+            key = text[:19]
+            if window[0] <= key < window[1]:
+                return window[2]
+
+        ts = self._parse_ts(text)
         if ts is None:
             return None
-        return ts.astimezone(self.report_tz).date()
-
-    def _event_date_in_range(self, event: dict[str, Any], start: date, end: date) -> bool:
-        day = self._event_date(event)
-        if day is None:
-            return False
-        return start <= day <= end
+        day = ts.astimezone(self.report_tz).date()
+
+        start = datetime.combine(day, time.min, tzinfo=self.report_tz)
+        end = datetime.combine(day + timedelta(days=1), time.min, tzinfo=self.report_tz)
+        start_utc = start.astimezone(timezone.utc)
+        end_utc = end.astimezone(timezone.utc)
+        if start_utc.astimezone(self.report_tz).date() == day and end_utc.astimezone(self.report_tz).date() > day:
+            self._event_day_window = (
+                start_utc.strftime("%Y-%m-%dT%H:%M:%S"),
+                end_utc.strftime("%Y-%m-%dT%H:%M:%S"),
+                day,
+            )
+        return day
+
+    def _prefetch_report_logs(self) -> None:
+        """Bring the JSONL cache up to date for the digest logs, reading stale files concurrently.
+
+        Only worth a thread pool when more than one log has unread bytes, e.g.
+        the first report after start-up; warm caches skip straight through.
+        """
+        self.flush()
+        stale: list[Path] = []
+        fresh = self._fresh_paths
+        for path in (self.activity_path, self.portfolio_path, self.decision_journal_path, self.metadata_path):
+            if fresh is not None and path in fresh:
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entry = self._jsonl_cache.get(path)
+            if entry is None or entry.offset != stat.st_size or entry.mtime_ns != stat.st_mtime_ns:
+                stale.append(path)
+        if len(stale) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=len(stale), thread_name_prefix="report-read") as pool:
+            list(pool.map(self._read_jsonl, stale))
 
     def _read_jsonl(self, path: Path) -> list[dict[str, Any]]:
-        if not path.exists():
-            return []
-
-        rows: list[dict[str, Any]] = []
+        """Return the parsed rows of an append-only JSONL log.
+
+        Rows are cached per path and only bytes appended since the previous
+        call are parsed, so every digest in a report build shares one parse.
+        A shrunk or replaced file, or one rewritten in place to the same
+        length (same size, newer mtime), is re-read from the start.
+        The returned list is shared with the cache and must not be mutated.
+        """
+        self.flush()
+        fresh = self._fresh_paths
+        if fresh is not None and path in fresh:
+            cached = self._jsonl_cache.get(path)
+            if cached is not None:
+                return cached.rows
         try:
-            for raw in path.read_text(encoding="utf-8").splitlines():
-                line = raw.strip()
-                if not line:
-                    continue
-                try:
-                    payload = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if isinstance(payload, dict):
-                    rows.append(payload)
-        except Exception:
+            stat = path.stat()
+        except OSError:
+            self._jsonl_cache.pop(path, None)
             return []
 
+        entry = self._jsonl_cache.get(path)
+        if entry is not None and entry.inode == stat.st_ino and entry.mtime_ns == stat.st_mtime_ns:
+            if stat.st_size == entry.offset:
+                if fresh is not None:
+                    fresh.add(path)
+                return entry.rows
+        elif (
+            entry is None
+            or entry.inode != stat.st_ino
+            or stat.st_size < entry.offset
+            or (stat.st_size == entry.offset and entry.offset > 0)
+        ):
+            entry = _JsonlCacheEntry(inode=stat.st_ino, offset=0, rows=[])
+            self._jsonl_cache[path] = entry
+        entry.mtime_ns = stat.st_mtime_ns
+        offset, rows = entry.offset, entry.rows
+
+        if stat.st_size > offset:
+            tail = b""
+            try:
+                with path.open("rb") as handle:
+                    handle.seek(offset)
+                    while True:
+                        block = handle.read(JSONL_READ_BLOCK_SIZE)
+                        if not block:
+                            break
+                        buffer = tail + block if tail else block
+                        complete = buffer.rfind(b"\n") + 1
+                        if complete:
+                            _parse_jsonl_lines(buffer[:complete].split(b"\n"), rows)
+                            offset += complete
+                        tail = buffer[complete:]
+            except OSError:
+                entry.offset = offset
+                return rows
+
+            if tail.strip():
+                # A last line without a newline is only consumed once it parses;
+                # otherwise it may still be mid-write.
+                before = len(rows)
+                _parse_jsonl_lines((tail,), rows)
+                if len(rows) > before:
+                    offset += len(tail)
+
+        entry.offset = offset
+        if fresh is not None:
+            fresh.add(path)
         return rows
+
+    def _read_jsonl_between(self, path: Path, start: date, end: date) -> list[dict[str, Any]]:
+        """Return rows whose report-timezone date falls in ``[start, end]``, in file order."""
+        rows, indices = self._row_indices_between(path, start, end)
+        return [rows[idx] for idx in indices]
+
+    def _read_column_between(self, path: Path, key: str, start: date, end: date) -> list[Any]:
+        """Return the ``key`` column (see ``_COLUMN_EXTRACTORS``) for rows in ``[start, end]``.
+
+        Each row's value is coerced once and kept alongside the cached rows, so
+        repeated digests read plain numbers instead of re-coercing dict fields.
+        """
+        rows, indices = self._row_indices_between(path, start, end)
+        entry = self._jsonl_cache.get(path)
+        if entry is None:
+            return []
+        column = entry.columns.setdefault(key, [])
+        if len(column) < len(rows):
+            column.extend(map(_COLUMN_EXTRACTORS[key], itertools.islice(rows, len(column), None)))
+        return [column[idx] for idx in indices]
+
+    def _row_indices_between(self, path: Path, start: date, end: date) -> tuple[list[dict[str, Any]], list[int]]:
+        """Return the cached rows of ``path`` and the ascending indices dated in ``[start, end]``."""
+        rows = self._read_jsonl(path)
+        entry = self._jsonl_cache.get(path)
+        if entry is None:
+            return rows, []
+
+        day_index = entry.day_index
+        for idx in range(entry.indexed_rows, len(rows)):
+            day = self._event_date(rows[idx])
+            if day is not None:
+                day_index.setdefault(day, []).append(idx)
+        entry.indexed_rows = len(rows)
+
+        if start == end:
+            return rows, day_index.get(start, [])
+        span = (end - start).days + 1
+        if span <= 0:
+            return rows, []
+        if span < len(day_index):
+            # Short windows over a long history: probe each day instead of scanning every bucket.
+            buckets = [day_index[day] for day in _date_range(start, span) if day in day_index]
+        else:
+            buckets = [indices for day, indices in day_index.items() if start <= day <= end]
+        return rows, list(heapq.merge(*buckets))
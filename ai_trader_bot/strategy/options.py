@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import math
+import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 
 
+# Leading run of letters in an OCC-style symbol such as "AAPL260117C00200000".
+_LEADING_LETTERS = re.compile(r"[^\W\d_]+")
+
+
 @dataclass(frozen=True)
 class OptionContract:
     symbol: str
@@ -19,6 +26,11 @@ class OptionContract:
 
 
 def _to_float(value: object, default: float = 0.0) -> float:
+    # Parsed chains are mostly JSON numbers already; skip the generic coercion for them.
+    if type(value) is float:
+        return value
+    if type(value) is int:
+        return float(value)
     try:
         return float(value)  # type: ignore[arg-type]
     except (TypeError, ValueError):
@@ -26,6 +38,8 @@ def _to_float(value: object, default: float = 0.0) -> float:
 
 
 def _to_int(value: object, default: int = 0) -> int:
+    if type(value) is int:
+        return value
     try:
         return int(float(value))  # type: ignore[arg-type]
     except (TypeError, ValueError):
@@ -39,11 +53,15 @@ def _extract_dte(expiration_key: str, fallback: int = 0) -> int:
     return _to_int(tail, fallback)
 
 
-def extract_call_contracts(option_chain: dict) -> list[OptionContract]:
-    result: list[OptionContract] = []
+# (raw, symbol, dte, delta, bid, ask, mark, basis) for a priced call quote.
+_PricedCall = tuple[dict, str, int, float | None, float, float, float, float]
+
+
+def _iter_priced_calls(option_chain: dict) -> Iterator[_PricedCall]:
+    """Yield the fields needed to filter calls, leaving the rest of each quote unparsed."""
     call_map = option_chain.get("callExpDateMap")
     if not isinstance(call_map, dict):
-        return result
+        return
 
     for expiration_key, strike_map in call_map.items():
         if not isinstance(strike_map, dict):
@@ -64,35 +82,35 @@ def extract_call_contracts(option_chain: dict) -> list[OptionContract]:
                 bid = _to_float(raw.get("bid"))
                 ask = _to_float(raw.get("ask"))
                 mark = _to_float(raw.get("mark"))
+                basis = ask if ask > 0 else (mark if mark > 0 else bid)
+                if basis <= 0:
+                    continue
+
                 delta_raw = raw.get("delta")
                 delta = _to_float(delta_raw) if delta_raw is not None else None
                 dte = _to_int(raw.get("daysToExpiration"), inferred_dte)
-                strike = _to_float(raw.get("strikePrice"))
-                volume = _to_int(raw.get("totalVolume"))
-                open_interest = _to_int(raw.get("openInterest"))
-                underlying = str(raw.get("underlyingSymbol") or "").strip() or option_underlying(symbol)
+                yield raw, symbol, dte, delta, bid, ask, mark, basis
+
+
+def _build_contract(priced: _PricedCall) -> OptionContract:
+    raw, symbol, dte, delta, bid, ask, mark, basis = priced
+    return OptionContract(
+        symbol=symbol,
+        underlying=str(raw.get("underlyingSymbol") or "").strip() or option_underlying(symbol),
+        strike=_to_float(raw.get("strikePrice")),
+        dte=dte,
+        delta=delta,
+        bid=bid,
+        ask=ask,
+        mark=mark,
+        volume=_to_int(raw.get("totalVolume")),
+        open_interest=_to_int(raw.get("openInterest")),
+        premium_per_contract=basis * 100.0,
+    )
 
-                basis = ask if ask > 0 else (mark if mark > 0 else bid)
-                if basis <= 0:
-                    continue
 
-                result.append(
-                    OptionContract(
-                        symbol=symbol,
-                        underlying=underlying,
-                        strike=strike,
-                        dte=dte,
-                        delta=delta,
-                        bid=bid,
-                        ask=ask,
-                        mark=mark,
-                        volume=volume,
-                        open_interest=open_interest,
-                        premium_per_contract=basis * 100.0,
-                    )
-                )
-
-    return result
+def extract_call_contracts(option_chain: dict) -> list[OptionContract]:
+    return [_build_contract(priced) for priced in _iter_priced_calls(option_chain)]
 
 
 def choose_bullish_call(
@@ -103,46 +121,41 @@ def choose_bullish_call(
     max_dte: int,
     target_delta: float,
 ) -> OptionContract | None:
-    candidates = extract_call_contracts(option_chain)
-    filtered: list[tuple[float, OptionContract]] = []
+    # Filter and score on the raw quotes; only the winner becomes an OptionContract.
+    best: _PricedCall | None = None
+    best_quality = math.inf
 
-    for contract in candidates:
-        if contract.dte < min_dte or contract.dte > max_dte:
+    for priced in _iter_priced_calls(option_chain):
+        raw, _, dte, delta, bid, ask, _, basis = priced
+        if dte < min_dte or dte > max_dte:
             continue
-        if contract.premium_per_contract > max_premium_dollars:
+        if basis * 100.0 > max_premium_dollars:
             continue
 
-        if contract.delta is not None:
-            abs_delta = abs(contract.delta)
+        if delta is not None:
+            abs_delta = abs(delta)
             if abs_delta < 0.20 or abs_delta > 0.70:
                 continue
         else:
             abs_delta = target_delta
 
-        spread = (contract.ask - contract.bid) if contract.ask > 0 and contract.bid > 0 else contract.ask
-        liquidity_bonus = 0.0005 * contract.open_interest + 0.0002 * contract.volume
+        spread = (ask - bid) if ask > 0 and bid > 0 else ask
+        liquidity_bonus = 0.0005 * _to_int(raw.get("openInterest")) + 0.0002 * _to_int(raw.get("totalVolume"))
 
         quality = abs(abs_delta - target_delta) + (0.03 * max(spread, 0.0)) - liquidity_bonus
-        filtered.append((quality, contract))
-
-    if not filtered:
-        return None
+        # Strict comparison keeps the earliest contract on ties, as the previous stable sort did.
+        if quality < best_quality:
+            best_quality = quality
+            best = priced
 
-    filtered.sort(key=lambda item: item[0])
-    return filtered[0][1]
+    return _build_contract(best) if best is not None else None
 
 
 def option_underlying(option_symbol: str) -> str:
     clean = option_symbol.strip().upper()
-    head = clean.split(" ", 1)[0].strip()
+    head = clean.partition(" ")[0].strip()
     if head.isalpha():
         return head
 
-    letters: list[str] = []
-    for char in head:
-        if char.isalpha():
-            letters.append(char)
-            continue
-        break
-
-    return "".join(letters) or head
+    match = _LEADING_LETTERS.match(head)
+    return match.group(0) if match else head
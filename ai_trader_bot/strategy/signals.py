@@ -1,28 +1,26 @@
 from __future__ import annotations
 
-import statistics
+import math
 
 from ..core.models import Signal
 
 
+_SQRT_TRADING_DAYS = math.sqrt(252)
+
+
 def _daily_returns(closes: list[float]) -> list[float]:
-    if len(closes) < 2:
-        return []
-    returns: list[float] = []
-    for idx in range(1, len(closes)):
-        previous = closes[idx - 1]
-        current = closes[idx]
-        if previous <= 0:
-            continue
-        returns.append((current / previous) - 1.0)
-    return returns
+    # Pairwise walk without index arithmetic; non-positive closes are skipped as before.
+    return [(current / previous) - 1.0 for previous, current in zip(closes, closes[1:]) if previous > 0]
 
 
 def _annualized_volatility(closes: list[float], window: int = 20) -> float:
     returns = _daily_returns(closes[-(window + 1) :])
-    if len(returns) < 2:
+    count = len(returns)
+    if count < 2:
         return 0.0
-    return statistics.stdev(returns) * (252**0.5)
+    mean = math.fsum(returns) / count
+    variance = math.fsum((value - mean) * (value - mean) for value in returns) / (count - 1)
+    return math.sqrt(variance) * _SQRT_TRADING_DAYS
 
 
 def compute_signal(symbol: str, price: float, closes: list[float], news_score: float) -> Signal | None:
@@ -56,7 +54,7 @@ def compute_signal_with_ai(
 
     momentum_20d = (closes[-1] / closes[-21]) - 1.0
     momentum_5d = (closes[-1] / closes[-6]) - 1.0
-    sma_20 = statistics.fmean(closes[-20:])
+    sma_20 = math.fsum(closes[-20:]) / 20.0
     trend_20d = (closes[-1] / sma_20) - 1.0 if sma_20 > 0 else 0.0
     volatility_20d = _annualized_volatility(closes, window=20)
 
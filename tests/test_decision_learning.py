@@ -5,12 +5,60 @@ import tempfile
 import unittest
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 from ai_trader_bot.learning.decision_learning import DecisionLearningStore, signal_feature_profile
 from ai_trader_bot.core.models import Signal
 
 
 class DecisionLearningTests(unittest.TestCase):
+    @staticmethod
+    def _profile(signal: Signal) -> dict[str, float]:
+        return signal_feature_profile(
+            signal,
+            ai_short_term_weight=0.10,
+            ai_long_term_weight=0.15,
+        )
+
+    def test_returns_inside_noise_floor_leave_penalties_unchanged(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = DecisionLearningStore(
+                state_path=str(Path(tmp_dir) / "state.json"),
+                journal_path=str(Path(tmp_dir) / "journal.jsonl"),
+                evaluation_horizon_hours=24,
+                bad_call_return_threshold=0.0,
+                good_call_return_threshold=0.02,
+                learning_rate=0.5,
+                max_feature_penalty=0.75,
+            )
+            signal = Signal(
+                symbol="NVDA",
+                price=100.0,
+                momentum_20d=0.10,
+                momentum_5d=0.05,
+                trend_20d=0.03,
+                volatility_20d=0.20,
+                news_score=0.40,
+                score=0.18,
+                ai_short_term_score=0.30,
+                ai_long_term_score=0.20,
+                ai_confidence=0.70,
+            )
+            store.maybe_record_call(
+                signal=signal,
+                feature_profile=self._profile(signal),
+                entry_threshold=0.012,
+                option_threshold=0.035,
+            )
+            store.open_calls["NVDA"]["created_at"] = (datetime.now(timezone.utc) - timedelta(hours=30)).isoformat()
+
+            resolved = store.maybe_resolve_call(symbol="NVDA", current_price=99.995)
+
+            assert resolved is not None
+            self.assertEqual(resolved["outcome"], "bad_call")
+            self.assertEqual(resolved["penalty_update"], {})
+            self.assertEqual(store.feature_penalties.get("news_score", 0.0), 0.0)
+
     def test_bad_call_increases_penalty_and_applies_cross_ticker(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             state_path = Path(tmp_dir) / "state.json"
@@ -39,11 +87,7 @@ class DecisionLearningTests(unittest.TestCase):
                 ai_long_term_score=0.20,
                 ai_confidence=0.70,
             )
-            profile = signal_feature_profile(
-                signal,
-                ai_short_term_weight=0.10,
-                ai_long_term_weight=0.15,
-            )
+            profile = self._profile(signal)
 
             store.maybe_record_call(
                 signal=signal,
@@ -56,7 +100,6 @@ class DecisionLearningTests(unittest.TestCase):
 
             # Force the call to be old enough for resolution.
             store.open_calls["NVDA"]["created_at"] = (datetime.now(timezone.utc) - timedelta(hours=30)).isoformat()
-            store._save()
 
             resolved = store.maybe_resolve_call(symbol="NVDA", current_price=95.0)
             self.assertIsNotNone(resolved)
@@ -106,11 +149,7 @@ class DecisionLearningTests(unittest.TestCase):
                 ai_long_term_score=0.0,
                 ai_confidence=0.0,
             )
-            profile = signal_feature_profile(
-                signal,
-                ai_short_term_weight=0.10,
-                ai_long_term_weight=0.15,
-            )
+            profile = self._profile(signal)
             store.maybe_record_call(
                 signal=signal,
                 feature_profile=profile,
@@ -119,13 +158,14 @@ class DecisionLearningTests(unittest.TestCase):
             )
 
             store.open_calls["AMD"]["created_at"] = (datetime.now(timezone.utc) - timedelta(hours=3)).isoformat()
-            store._save()
             store.maybe_resolve_call(symbol="AMD", current_price=52.0)
 
             lines = [json.loads(line) for line in journal_path.read_text(encoding="utf-8").splitlines() if line.strip()]
             event_names = {line.get("event") for line in lines}
             self.assertIn("decision_call_opened", event_names)
             self.assertIn("decision_call_resolved", event_names)
+            resolved = [line for line in lines if line.get("event") == "decision_call_resolved"][0]
+            self.assertEqual(resolved["feature_profile"], profile)
 
     def test_source_bias_learns_from_trade_outcome(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -159,11 +199,7 @@ class DecisionLearningTests(unittest.TestCase):
                 ai_long_term_score=0.0,
                 ai_confidence=0.0,
             )
-            profile = signal_feature_profile(
-                signal,
-                ai_short_term_weight=0.10,
-                ai_long_term_weight=0.15,
-            )
+            profile = self._profile(signal)
             source_profile = {
                 "news": {"sentiment": 0.8, "count": 4, "multiplier": 1.0},
                 "social": {"sentiment": -0.4, "count": 1, "multiplier": 1.0},
@@ -177,7 +213,6 @@ class DecisionLearningTests(unittest.TestCase):
                 option_threshold=0.035,
             )
             store.open_calls["NVDA"]["created_at"] = (datetime.now(timezone.utc) - timedelta(hours=3)).isoformat()
-            store._save()
             store.maybe_resolve_call(symbol="NVDA", current_price=110.0)
 
             self.assertGreater(store.source_bias.get("news", 0.0), 0.0)
@@ -218,6 +253,36 @@ class DecisionLearningTests(unittest.TestCase):
             self.assertIsNotNone(second)
             self.assertGreater(store.source_bias.get("news", 0.0), 0.0)
 
+    def test_save_is_atomic_and_skips_unchanged_state(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_path = Path(tmp_dir) / "state.json"
+            journal_path = Path(tmp_dir) / "journal.jsonl"
+
+            store = DecisionLearningStore(
+                state_path=str(state_path),
+                journal_path=str(journal_path),
+                evaluation_horizon_hours=24,
+                bad_call_return_threshold=-0.02,
+                good_call_return_threshold=0.02,
+                learning_rate=0.3,
+                max_feature_penalty=0.75,
+            )
+            store.feature_penalties["news_score"] = 0.2
+            store._save()
+            first = state_path.read_text(encoding="utf-8")
+            self.assertFalse((Path(tmp_dir) / "state.json.tmp").exists())
+
+            store._save()
+            self.assertEqual(state_path.read_text(encoding="utf-8"), first)
+
+            store.feature_penalties["news_score"] = 0.3
+            with patch("ai_trader_bot.learning.decision_learning.json.dumps", wraps=json.dumps) as dumps:
+                store._save()
+            self.assertEqual(dumps.call_count, 2)  # state text plus the updated_at value
+            payload = json.loads(state_path.read_text(encoding="utf-8"))
+            self.assertAlmostEqual(payload["feature_penalties"]["news_score"], 0.3)
+            self.assertEqual(list(payload)[-1], "updated_at")
+
 
 if __name__ == "__main__":
     unittest.main()
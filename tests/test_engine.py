@@ -8,57 +8,58 @@ from ai_trader_bot.core.models import PortfolioSnapshot, Signal
 from ai_trader_bot.learning.ai_interpreter import LLMDecisionPlan
 
 
+# Option chains served by FakeBroker; shared read-only across calls.
+_OPTION_CHAINS: dict[str, dict] = {
+    "NVDA": {
+        "callExpDateMap": {
+            "2026-04-17:30": {
+                "900.0": [
+                    {
+                        "symbol": "NVDA  260417C00900000",
+                        "underlyingSymbol": "NVDA",
+                        "strikePrice": 900.0,
+                        "daysToExpiration": 30,
+                        "delta": 0.45,
+                        "bid": 1.10,
+                        "ask": 1.20,
+                        "mark": 1.15,
+                        "totalVolume": 500,
+                        "openInterest": 3000,
+                    }
+                ]
+            }
+        }
+    },
+    "AMD": {
+        "callExpDateMap": {
+            "2026-04-17:30": {
+                "190.0": [
+                    {
+                        "symbol": "AMD  260417C00190000",
+                        "underlyingSymbol": "AMD",
+                        "strikePrice": 190.0,
+                        "daysToExpiration": 30,
+                        "delta": 0.42,
+                        "bid": 0.95,
+                        "ask": 1.00,
+                        "mark": 0.98,
+                        "totalVolume": 800,
+                        "openInterest": 2500,
+                    }
+                ]
+            }
+        }
+    },
+}
+
+
 class FakeBroker:
     def __init__(self) -> None:
         self.chain_requests: list[str] = []
 
     def get_option_chain(self, symbol: str) -> dict:
         self.chain_requests.append(symbol)
-        if symbol == "NVDA":
-            return {
-                "callExpDateMap": {
-                    "2026-04-17:30": {
-                        "900.0": [
-                            {
-                                "symbol": "NVDA  260417C00900000",
-                                "underlyingSymbol": "NVDA",
-                                "strikePrice": 900.0,
-                                "daysToExpiration": 30,
-                                "delta": 0.45,
-                                "bid": 1.10,
-                                "ask": 1.20,
-                                "mark": 1.15,
-                                "totalVolume": 500,
-                                "openInterest": 3000,
-                            }
-                        ]
-                    }
-                }
-            }
-
-        if symbol == "AMD":
-            return {
-                "callExpDateMap": {
-                    "2026-04-17:30": {
-                        "190.0": [
-                            {
-                                "symbol": "AMD  260417C00190000",
-                                "underlyingSymbol": "AMD",
-                                "strikePrice": 190.0,
-                                "daysToExpiration": 30,
-                                "delta": 0.42,
-                                "bid": 0.95,
-                                "ask": 1.00,
-                                "mark": 0.98,
-                                "totalVolume": 800,
-                                "openInterest": 2500,
-                            }
-                        ]
-                    }
-                }
-            }
-
-        return {}
+        return _OPTION_CHAINS.get(symbol, {})
 
 
 class EngineOptionTests(unittest.TestCase):
@@ -16,6 +16,13 @@ class MarketCalendarTests(unittest.TestCase):
     def test_thanksgiving_closed(self) -> None:
         self.assertFalse(is_us_equity_market_day(date(2026, 11, 26)))
 
+    def test_saturday_new_year_is_not_observed_on_prior_friday(self) -> None:
+        # 2022-01-01 fell on a Saturday; NYSE stayed open Friday 2021-12-31.
+        self.assertTrue(is_us_equity_market_day(date(2021, 12, 31)))
+
+    def test_sunday_new_year_observed_on_monday(self) -> None:
+        self.assertFalse(is_us_equity_market_day(date(2023, 1, 2)))
+
 
 if __name__ == "__main__":
     unittest.main()
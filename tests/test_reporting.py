@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import gc
 import json
+import math
+import os
 import tempfile
+import threading
 import unittest
+import weakref
+from unittest.mock import patch
 from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
 from pathlib import Path
 
 from ai_trader_bot.core.config import BotConfig
 from ai_trader_bot.reporting import ReportManager
+from ai_trader_bot.reporting import manager as manager_module
+from ai_trader_bot.reporting.manager import _equity_stats, _jsonl_line
 
 
 class ReportingTests(unittest.TestCase):
@@ -29,6 +38,11 @@ class ReportingTests(unittest.TestCase):
             decision_learning_state_path=str(base / "decision_state.json"),
         )
 
+    @staticmethod
+    def _read_jsonl(path: str) -> list[dict]:
+        with open(path, encoding="utf-8") as handle:
+            return [json.loads(line) for line in handle if line.strip()]
+
     def test_daily_digest_contains_per_stock_reasoning(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             config = self._config(tmp_dir)
@@ -63,6 +77,7 @@ class ReportingTests(unittest.TestCase):
                         "volatility_20d": 0.35,
                     }
                 },
+                "decision_metadata": {"signals_generated": 3, "orders_proposed": 1},
             }
 
             manager.record_cycle(summary, timestamp=timestamp)
@@ -76,6 +91,7 @@ class ReportingTests(unittest.TestCase):
             self.assertIn("Buy decision", body)
             self.assertIn("research sentiment", body)
             self.assertIn("System metadata", body)
+            self.assertIn("Cycles run: 1, avg signals/cycle: 3.00, trade-capable cycles with no orders: 0", body)
             self.assertIn("Quarter goal", body)
 
     def test_weekly_digest_computes_portfolio_change(self) -> None:
@@ -148,6 +164,39 @@ class ReportingTests(unittest.TestCase):
             self.assertIn("Recommended model-strength changes", body)
             self.assertIn("Historical Research Weight", body)
 
+    def test_model_strength_rules_follow_quarter_regime(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = self._config(tmp_dir)
+            manager = ReportManager(config)
+
+            stressed = {
+                row["key"]: row
+                for row in manager._recommend_model_strengths(
+                    quarter_return_pct=-0.05,
+                    max_drawdown_pct=0.9,
+                    bad_call_rate=None,
+                    no_trade_ratio=None,
+                )
+            }
+            self.assertAlmostEqual(
+                stressed["ai_feedback_strength"]["recommended"],
+                round(min(0.20, max(0.04, config.ai_feedback_strength + 0.01)), 3),
+            )
+            self.assertIn("Slightly increased", stressed["ai_feedback_strength"]["reason"])
+
+            mixed = {
+                row["key"]: row
+                for row in manager._recommend_model_strengths(
+                    quarter_return_pct=0.0,
+                    max_drawdown_pct=0.0,
+                    bad_call_rate=0.55,
+                    no_trade_ratio=0.9,
+                )
+            }
+            self.assertIn("low-activity", mixed["decision_learning_rate"]["reason"])
+            self.assertIn("source-quality", mixed["source_priority_learning_rate"]["reason"])
+            self.assertFalse(mixed["ai_feedback_strength"]["changed"])
+
     def test_model_roadmap_advisor_digest_for_q1_contains_new_models(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             config = self._config(tmp_dir)
@@ -207,16 +256,8 @@ class ReportingTests(unittest.TestCase):
             self.assertEqual(manager.state.last_quarterly_advisor_target, "2026-01-01")
             self.assertEqual(manager.state.last_model_roadmap_target, "2026-01-01")
 
-            quarterly_lines = [
-                json.loads(line)
-                for line in Path(config.quarterly_model_advisor_log_path).read_text(encoding="utf-8").splitlines()
-                if line.strip()
-            ]
-            roadmap_lines = [
-                json.loads(line)
-                for line in Path(config.model_roadmap_log_path).read_text(encoding="utf-8").splitlines()
-                if line.strip()
-            ]
+            quarterly_lines = self._read_jsonl(config.quarterly_model_advisor_log_path)
+            roadmap_lines = self._read_jsonl(config.model_roadmap_log_path)
             self.assertTrue(any(row.get("event") == "quarterly_model_advisor" for row in quarterly_lines))
             self.assertTrue(any(row.get("event") == "model_roadmap_advisor" for row in roadmap_lines))
             quarterly_event = next(row for row in quarterly_lines if row.get("event") == "quarterly_model_advisor")
@@ -231,6 +272,29 @@ class ReportingTests(unittest.TestCase):
             self.assertIn("effort", first_recommendation)
             self.assertIn("estimate", first_recommendation)
 
+    def test_scheduler_evaluates_closing_quarter_once_for_both_advisors(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = self._config(tmp_dir)
+            config.quarterly_model_advisor_reminder_days = 14
+            config.model_roadmap_reminder_days = 14
+            config.model_roadmap_target_quarters = [1, 3]
+            manager = ReportManager(config)
+            manager.record_cycle(
+                {"cash": 500.0, "account_equity": 1000.0, "orders": [], "execute_orders": True},
+                timestamp=datetime(2025, 12, 10, 18, 0, tzinfo=timezone.utc),
+            )
+
+            with patch.object(manager, "_compute_quarter_window", wraps=manager._compute_quarter_window) as compute:
+                manager.maybe_send_scheduled_reports(now=datetime(2025, 12, 18, 23, 0, tzinfo=timezone.utc))
+            self.assertEqual(compute.call_count, 1)
+            self.assertEqual(manager.state.last_quarterly_advisor_target, "2026-01-01")
+            self.assertEqual(manager.state.last_model_roadmap_target, "2026-01-01")
+
+            quarterly_event = self._read_jsonl(config.quarterly_model_advisor_log_path)[-1]
+            roadmap_event = self._read_jsonl(config.model_roadmap_log_path)[-1]
+            self.assertEqual(quarterly_event["metrics"]["quarter_return_pct"], roadmap_event["metrics"]["quarter_return_pct"])
+            self.assertEqual(manager._quarter_metrics_memo, {})
+
     def test_bootstrap_daily_optimization_report_logs_metrics_and_suggestions(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             config = self._config(tmp_dir)
@@ -267,11 +331,7 @@ class ReportingTests(unittest.TestCase):
             manager.maybe_send_scheduled_reports(now=datetime(2026, 2, 18, 23, 5, tzinfo=timezone.utc))
 
             self.assertEqual(manager.state.last_bootstrap_optimization_date, "2026-02-18")
-            log_rows = [
-                json.loads(line)
-                for line in Path(config.bootstrap_optimization_log_path).read_text(encoding="utf-8").splitlines()
-                if line.strip()
-            ]
+            log_rows = self._read_jsonl(config.bootstrap_optimization_log_path)
             event = next(row for row in log_rows if row.get("event") == "bootstrap_optimization_report")
             self.assertIsInstance(event.get("metrics"), dict)
             self.assertIsInstance(event.get("comparison"), dict)
@@ -312,21 +372,369 @@ class ReportingTests(unittest.TestCase):
 
             manager.maybe_send_scheduled_reports(now=datetime(2026, 2, 18, 23, 5, tzinfo=timezone.utc))
 
-            daily_rows = [
-                json.loads(line)
-                for line in Path(config.daily_report_log_path).read_text(encoding="utf-8").splitlines()
-                if line.strip()
-            ]
+            daily_rows = self._read_jsonl(config.daily_report_log_path)
             self.assertTrue(any(row.get("event") == "daily_report" for row in daily_rows))
 
-            research_rows = [
-                json.loads(line)
-                for line in Path(config.research_log_path).read_text(encoding="utf-8").splitlines()
-                if line.strip()
-            ]
+            research_rows = self._read_jsonl(config.research_log_path)
             self.assertEqual(len(research_rows), 1)
             self.assertEqual(research_rows[0].get("event"), "research_item")
 
+    def test_recent_research_ids_are_loaded_from_log_tail(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = self._config(tmp_dir)
+            research_path = Path(config.research_log_path)
+            with research_path.open("w", encoding="utf-8") as handle:
+                for idx in range(50):
+                    handle.write(json.dumps({"event": "research_item", "item_id": f"id-{idx}"}) + "\n")
+                handle.write("\n")
+                handle.write("not json\n")
+                handle.write(json.dumps({"event": "research_item", "item_id": "0123abcd"}) + "\n")
+
+            manager = ReportManager(config)
+            self.assertEqual(
+                manager._load_recent_research_ids(limit=12),
+                [f"id-{idx}" for idx in range(40, 50)] + ["0123abcd"],
+            )
+            self.assertEqual(len(manager._research_seen_ids), 51)
+
+    def test_research_dedupe_window_evicts_oldest_ids(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manager = ReportManager(self._config(tmp_dir))
+            with patch("ai_trader_bot.reporting.manager.RESEARCH_DEDUPE_WINDOW", 3):
+                for item_id in ("a", "b", "c", "d"):
+                    self.assertTrue(manager._remember_research_id(item_id))
+                self.assertFalse(manager._remember_research_id("d"))
+                self.assertEqual(manager._research_seen_ids, {"b", "c", "d"})
+                self.assertTrue(manager._remember_research_id("a"))
+
+    def test_read_jsonl_parses_appended_rows_incrementally(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = self._config(tmp_dir)
+            manager = ReportManager(config)
+            path = Path(tmp_dir) / "events.jsonl"
+
+            path.write_text('{"n": 1}\n{"n": 2}\n{"n": 3}', encoding="utf-8")
+            self.assertEqual([row["n"] for row in manager._read_jsonl(path)], [1, 2, 3])
+
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write('\n{"n": 4}\n{"n": ')
+            self.assertEqual([row["n"] for row in manager._read_jsonl(path)], [1, 2, 3, 4])
+
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write("5}\n")
+            self.assertEqual([row["n"] for row in manager._read_jsonl(path)], [1, 2, 3, 4, 5])
+
+            path.write_text('{"n": 9}\n', encoding="utf-8")
+            self.assertEqual([row["n"] for row in manager._read_jsonl(path)], [9])
+
+            # Same-length rewrite in place is detected through the newer mtime.
+            stat = path.stat()
+            path.write_text('{"n": 8}\n', encoding="utf-8")
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual([row["n"] for row in manager._read_jsonl(path)], [8])
+
+            path.unlink()
+            self.assertEqual(manager._read_jsonl(path), [])
+
+    def test_read_jsonl_reassembles_lines_split_across_read_blocks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manager = ReportManager(self._config(tmp_dir))
+            path = Path(tmp_dir) / "events.jsonl"
+            path.write_text("".join(json.dumps({"n": idx, "pad": "x" * idx}) + "\n" for idx in range(20)), encoding="utf-8")
+
+            with patch("ai_trader_bot.reporting.manager.JSONL_READ_BLOCK_SIZE", 7):
+                rows = manager._read_jsonl(path)
+            self.assertEqual([row["n"] for row in rows], list(range(20)))
+
+    def test_read_jsonl_between_buckets_by_report_timezone_date(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = self._config(tmp_dir)
+            manager = ReportManager(config)
+            path = Path(tmp_dir) / "events.jsonl"
+            timestamps = [
+                "2026-02-13T15:00:00+00:00",
+                "2026-02-14T15:00:00+00:00",
+                "2026-02-15T03:00:00+00:00",  # 2026-02-14 22:00 in New York
+                "2026-02-15T15:00:00+00:00",
+            ]
+            path.write_text(
+                "".join(json.dumps({"n": idx, "timestamp": ts}) + "\n" for idx, ts in enumerate(timestamps)),
+                encoding="utf-8",
+            )
+
+            same_day = manager._read_jsonl_between(path, date(2026, 2, 14), date(2026, 2, 14))
+            self.assertEqual([row["n"] for row in same_day], [1, 2])
+            window = manager._read_jsonl_between(path, date(2026, 2, 13), date(2026, 2, 15))
+            self.assertEqual([row["n"] for row in window], [0, 1, 2, 3])
+            window = manager._read_jsonl_between(path, date(2026, 2, 13), date(2026, 2, 14))
+            self.assertEqual([row["n"] for row in window], [0, 1, 2])
+            self.assertEqual(manager._read_jsonl_between(path, date(2026, 2, 15), date(2026, 2, 13)), [])
+
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps({"n": 4, "timestamp": "2026-02-14T20:00:00+00:00"}) + "\n")
+            same_day = manager._read_jsonl_between(path, date(2026, 2, 14), date(2026, 2, 14))
+            self.assertEqual([row["n"] for row in same_day], [1, 2, 4])
+
+    def test_read_column_between_coerces_values_once_per_row(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manager = ReportManager(self._config(tmp_dir))
+            path = Path(tmp_dir) / "portfolio.jsonl"
+            rows = [
+                {"timestamp": "2026-02-13T15:00:00+00:00", "account_equity": "100.5"},
+                {"timestamp": "2026-02-14T15:00:00+00:00", "account_equity": None},
+                {"timestamp": "2026-02-14T16:00:00+00:00", "account_equity": 102},
+            ]
+            path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+
+            day = manager._read_column_between(path, "account_equity", date(2026, 2, 14), date(2026, 2, 14))
+            self.assertEqual(day, [0.0, 102.0])
+            window = manager._read_column_between(path, "account_equity", date(2026, 2, 13), date(2026, 2, 14))
+            self.assertEqual(window, [100.5, 0.0, 102.0])
+
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps({"timestamp": "2026-02-14T17:00:00+00:00", "account_equity": 99.0}) + "\n")
+            day = manager._read_column_between(path, "account_equity", date(2026, 2, 14), date(2026, 2, 14))
+            self.assertEqual(day, [0.0, 102.0, 99.0])
+
+    def test_event_date_uses_cached_utc_bounds_across_local_midnight(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manager = ReportManager(self._config(tmp_dir))
+            cases = [
+                ("2026-02-14T15:00:00+00:00", date(2026, 2, 14)),
+                ("2026-02-14T20:30:00.123456+00:00", date(2026, 2, 14)),
+                ("2026-02-15T04:59:59+00:00", date(2026, 2, 14)),
+                ("2026-02-15T05:00:00+00:00", date(2026, 2, 15)),
+                ("2026-02-15T04:59:59+00:00", date(2026, 2, 14)),
+                ("2026-02-15T00:30:00-05:00", date(2026, 2, 15)),
+                ("not-a-timestamp", None),
+            ]
+            for ts, expected in cases:
+                self.assertEqual(manager._event_date({"timestamp": ts}), expected, ts)
+
+    def test_equity_stats_tracks_extremes_and_running_peak_drawdown(self) -> None:
+        equity = [100.0, 120.0, 90.0, 110.0]
+        first, last, peak, trough, max_drawdown = _equity_stats(equity)
+        self.assertEqual((first, last, peak, trough), (100.0, 110.0, 120.0, 90.0))
+        self.assertAlmostEqual(max_drawdown, 0.25)
+
+        self.assertEqual(_equity_stats(equity + [0.0])[3], 0.0)
+        self.assertEqual(_equity_stats(equity + [0.0], missing_as_first=True)[3], 90.0)
+        self.assertEqual(_equity_stats([]), (0.0, 0.0, 0.0, 0.0, 0.0))
+        self.assertEqual(_equity_stats([250.0, 250.0, 250.0]), (250.0, 250.0, 250.0, 250.0, 0.0))
+
+    def test_current_feature_penalties_reload_only_when_state_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = self._config(tmp_dir)
+            manager = ReportManager(config)
+            path = Path(config.decision_learning_state_path)
+            self.assertEqual(manager._current_feature_penalties(), {})
+
+            path.write_text(json.dumps({"feature_penalties": {"news_score": 0.2, "bad": "x"}}), encoding="utf-8")
+            first = manager._current_feature_penalties()
+            self.assertEqual(first, {"news_score": 0.2})
+            self.assertIs(manager._current_feature_penalties(), first)
+
+            stat = path.stat()
+            path.write_text(json.dumps({"feature_penalties": {"news_score": 0.35}}), encoding="utf-8")
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual(manager._current_feature_penalties(), {"news_score": 0.35})
+
+    def test_latest_report_event_returns_newest_matching_row(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = self._config(tmp_dir)
+            manager = ReportManager(config)
+            path = Path(config.daily_report_log_path)
+            self.assertIsNone(manager._latest_report_event(path, "daily_report"))
+
+            rows = [
+                {"event": "daily_report", "report_date": "2026-02-12"},
+                {"event": "daily_report", "report_date": "2026-02-13"},
+                {"event": "other", "body": "mentions daily_report"},
+            ]
+            path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+
+            latest = manager._latest_report_event(path, "daily_report")
+            self.assertIsNotNone(latest)
+            assert latest is not None
+            self.assertEqual(latest["report_date"], "2026-02-13")
+            self.assertIsNone(manager._latest_report_event(path, "weekly_report"))
+            self.assertIs(manager._latest_report_event(path, "daily_report"), latest)
+
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps({"event": "daily_report", "report_date": "2026-02-16"}) + "\n")
+            latest = manager._latest_report_event(path, "daily_report")
+            assert latest is not None
+            self.assertEqual(latest["report_date"], "2026-02-16")
+
+    def test_report_sweep_reads_each_log_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = self._config(tmp_dir)
+            manager = ReportManager(config)
+            ts = datetime(2026, 2, 14, 18, 0, tzinfo=timezone.utc)
+            manager.record_cycle({"cash": 100.0, "account_equity": 1000.0, "orders": []}, timestamp=ts)
+
+            path = Path(config.portfolio_log_path)
+            with manager._report_sweep():
+                self.assertIsNotNone(manager.build_daily_digest(ts.date()))
+                self.assertIn(path, manager._fresh_paths)
+                self.assertIsNotNone(manager.build_weekly_digest(ts.date()))
+                self.assertEqual(len(manager._read_jsonl(path)), 1)
+                with path.open("a", encoding="utf-8") as handle:
+                    handle.write(json.dumps({"event": "portfolio_snapshot", "timestamp": ts.isoformat()}) + "\n")
+                self.assertEqual(len(manager._read_jsonl(path)), 1)
+                manager.record_cycle({"cash": 100.0, "account_equity": 1001.0, "orders": []}, timestamp=ts)
+                self.assertEqual(len(manager._read_jsonl(path)), 3)
+            self.assertIsNone(manager._fresh_paths)
+
+    def test_async_writes_are_flushed_before_reads(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = self._config(tmp_dir)
+            config.report_async_writes = True
+            manager = ReportManager(config)
+            try:
+                ts = datetime(2026, 2, 14, 18, 0, tzinfo=timezone.utc)
+                for idx in range(5):
+                    manager.record_cycle(
+                        {"cash": 100.0, "account_equity": 1000.0 + idx, "orders": []},
+                        timestamp=ts + timedelta(minutes=idx),
+                    )
+                snapshots = manager._read_jsonl_between(Path(config.portfolio_log_path), ts.date(), ts.date())
+                self.assertEqual([row["account_equity"] for row in snapshots], [1000.0, 1001.0, 1002.0, 1003.0, 1004.0])
+            finally:
+                manager.close()
+
+            manager.record_cycle({"cash": 100.0, "account_equity": 2000.0, "orders": []}, timestamp=ts)
+            lines = Path(config.portfolio_log_path).read_text(encoding="utf-8").splitlines()
+            self.assertEqual(len(lines), 6)
+
+    def test_flush_falls_back_to_synchronous_writes_when_writer_has_stopped(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = self._config(tmp_dir)
+            config.report_async_writes = True
+            manager = ReportManager(config)
+            ts = datetime(2026, 2, 14, 18, 0, tzinfo=timezone.utc)
+            writer = manager._log_writer
+            assert writer is not None
+
+            # Stop the writer thread behind the manager's back, then leave a write queued.
+            with writer._cond:
+                writer._stopped = True
+                writer._cond.notify_all()
+            writer._thread.join()
+            writer._pending.append((Path(config.portfolio_log_path), b'{"event":"portfolio_snapshot"}\n'))
+
+            manager.flush()
+            self.assertIsNone(manager._log_writer)
+            manager.record_cycle({"cash": 100.0, "account_equity": 1000.0, "orders": []}, timestamp=ts)
+
+            rows = self._read_jsonl(config.portfolio_log_path)
+            self.assertEqual(len(rows), 2)
+            self.assertEqual(rows[1]["account_equity"], 1000.0)
+
+    def test_backed_up_writer_falls_back_to_synchronous_writes_in_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = self._config(tmp_dir)
+            config.report_async_writes = True
+            config.enable_metadata_logging = False
+            ts = datetime(2026, 2, 14, 18, 0, tzinfo=timezone.utc)
+            release = threading.Event()
+            append = manager_module._append_log_bytes
+
+            def slow_append(path: Path, data: bytes, ensured_dirs: set[Path]) -> None:
+                release.wait(5.0)
+                append(path, data, ensured_dirs)
+
+            timer = threading.Timer(0.2, release.set)
+            with (
+                patch.object(manager_module, "WRITE_QUEUE_MAXSIZE", 1),
+                patch.object(manager_module, "WRITE_QUEUE_PUT_TIMEOUT", 0.05),
+                patch.object(manager_module, "_append_log_bytes", slow_append),
+                self.assertLogs(level="WARNING"),
+            ):
+                manager = ReportManager(config)
+                timer.start()
+                for idx in range(4):
+                    manager.record_cycle(
+                        {"cash": 100.0, "account_equity": 1000.0 + idx, "orders": []},
+                        timestamp=ts + timedelta(minutes=idx),
+                    )
+            timer.join()
+
+            self.assertIsNone(manager._log_writer)
+            rows = self._read_jsonl(config.portfolio_log_path)
+            self.assertEqual([row["account_equity"] for row in rows], [1000.0, 1001.0, 1002.0, 1003.0])
+
+    def test_async_writer_does_not_keep_manager_alive(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = self._config(tmp_dir)
+            config.report_async_writes = True
+            manager = ReportManager(config)
+            writer = manager._log_writer
+            assert writer is not None
+            manager.record_cycle(
+                {"cash": 100.0, "account_equity": 1000.0, "orders": []},
+                timestamp=datetime(2026, 2, 14, 18, 0, tzinfo=timezone.utc),
+            )
+
+            manager_ref = weakref.ref(manager)
+            del manager
+            gc.collect()
+
+            self.assertIsNone(manager_ref())
+            self.assertTrue(writer.stopped)
+            self.assertEqual(len(self._read_jsonl(config.portfolio_log_path)), 1)
+
+    def test_jsonl_line_writes_non_finite_floats_as_null(self) -> None:
+        # Force the stdlib fallback so _finite_or_none is exercised even when orjson is installed.
+        with patch("ai_trader_bot.reporting.manager.orjson", None):
+            line = _jsonl_line({"b": float("nan"), "a": [1.5, float("inf")], "c": {"d": float("-inf")}})
+        self.assertEqual(line, b'{"a":[1.5,null],"b":null,"c":{"d":null}}\n')
+
+    def test_stdlib_nan_log_lines_still_read_back(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = self._config(tmp_dir)
+            manager = ReportManager(config)
+            path = Path(config.portfolio_log_path)
+            rows = [
+                {"event": "portfolio_snapshot", "timestamp": "2026-02-18T20:00:00+00:00", "account_equity": float("nan")},
+                {"event": "portfolio_snapshot", "timestamp": "2026-02-18T20:05:00+00:00", "account_equity": 1000.0},
+            ]
+            path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+            self.assertIn("NaN", path.read_text(encoding="utf-8"))
+
+            read_back = manager._read_jsonl(path)
+            self.assertEqual(len(read_back), 2)
+            self.assertTrue(math.isnan(read_back[0]["account_equity"]))
+            self.assertEqual(read_back[1]["account_equity"], 1000.0)
+
+    def test_unserializable_record_is_skipped_without_aborting_cycle(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = self._config(tmp_dir)
+            manager = ReportManager(config)
+            ts = datetime(2026, 2, 18, 20, 0, tzinfo=timezone.utc)
+
+            with self.assertLogs(level="WARNING") as logs:
+                manager.record_cycle(
+                    {
+                        "cash": 100.0,
+                        "account_equity": 1000.0,
+                        "equity_positions": {"NVDA": Decimal("3")},
+                        "orders": [
+                            {"symbol": "NVDA", "asset_type": "EQUITY", "instruction": "BUY", "quantity": 1},
+                            {"symbol": "AMD", "asset_type": "EQUITY", "instruction": "BUY", "limit_price": Decimal("1")},
+                            {"symbol": "AVGO", "asset_type": "EQUITY", "instruction": "SELL", "quantity": 2},
+                        ],
+                    },
+                    timestamp=ts,
+                )
+
+            self.assertEqual(len(logs.output), 2)
+            self.assertIn("Failed writing report log", logs.output[0])
+            self.assertFalse(Path(config.portfolio_log_path).exists())
+            self.assertEqual(len(self._read_jsonl(config.metadata_log_path)), 1)
+            trades = self._read_jsonl(config.activity_log_path)
+            self.assertEqual([row["symbol"] for row in trades], ["NVDA", "AVGO"])
+
 
 if __name__ == "__main__":
     unittest.main()
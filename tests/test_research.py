@@ -1,14 +1,45 @@
 from __future__ import annotations
 
+import threading
+import time
 from datetime import datetime, timedelta, timezone
+from typing import Any
 from unittest import TestCase
 from unittest.mock import patch
 
 from ai_trader_bot.data.news import NewsItem
+from ai_trader_bot.data import research
 from ai_trader_bot.data.research import collect_research_items
 
 
 class ResearchTests(TestCase):
+    _COLLECT_DEFAULTS: dict[str, Any] = {
+        "news_lookback_hours": 6,
+        "sec_lookback_hours": 72,
+        "earnings_lookback_hours": 336,
+        "social_lookback_hours": 24,
+        "analyst_lookback_hours": 720,
+        "max_items_per_source": 5,
+        "total_items_cap": 5,
+        "timeout_seconds": 3.0,
+        "include_full_article_text": False,
+        "article_text_max_chars": 1200,
+        "enable_sec_filings": False,
+        "sec_user_agent": "ai-autotrader/0.2 (test)",
+        "sec_forms": ["10-Q"],
+        "enable_earnings_transcripts": False,
+        "fmp_api_key": "",
+        "earnings_transcript_max_chars": 2000,
+        "enable_social_feeds": False,
+        "social_feed_rss_urls": [],
+        "trusted_social_accounts": [],
+        "enable_analyst_ratings": False,
+        "finnhub_api_key": "",
+    }
+
+    def _collect(self, **overrides: Any) -> list[NewsItem]:
+        return collect_research_items("NVDA", "NVIDIA AI chips", **{**self._COLLECT_DEFAULTS, **overrides})
+
     def test_collect_research_items_merges_dedupes_and_caps(self) -> None:
         now = datetime.now(timezone.utc)
         duplicate = NewsItem(
@@ -46,30 +77,12 @@ class ResearchTests(TestCase):
             patch("ai_trader_bot.data.research.fetch_social_feed_items", return_value=[social_item]),
             patch("ai_trader_bot.data.research.fetch_analyst_rating_items", return_value=[]),
         ):
-            items = collect_research_items(
-                "NVDA",
-                "NVIDIA AI chips",
-                news_lookback_hours=6,
-                sec_lookback_hours=72,
-                earnings_lookback_hours=336,
-                social_lookback_hours=24,
-                analyst_lookback_hours=720,
-                max_items_per_source=5,
+            items = self._collect(
                 total_items_cap=10,
-                timeout_seconds=3.0,
-                include_full_article_text=False,
-                article_text_max_chars=1200,
                 enable_sec_filings=True,
-                sec_user_agent="ai-autotrader/0.2 (test)",
-                sec_forms=["10-Q"],
-                enable_earnings_transcripts=False,
-                fmp_api_key="",
-                earnings_transcript_max_chars=2000,
                 enable_social_feeds=True,
                 social_feed_rss_urls=["https://social.example/rss"],
                 trusted_social_accounts=["acct1"],
-                enable_analyst_ratings=False,
-                finnhub_api_key="",
             )
 
         self.assertEqual(len(items), 3)
@@ -92,35 +105,61 @@ class ResearchTests(TestCase):
             patch("ai_trader_bot.data.research.fetch_google_news_items", return_value=[news_item]),
             patch("ai_trader_bot.data.research.fetch_article_text", return_value="Full article body"),
         ):
-            items = collect_research_items(
-                "NVDA",
-                "NVIDIA AI chips",
-                news_lookback_hours=6,
-                sec_lookback_hours=72,
-                earnings_lookback_hours=336,
-                social_lookback_hours=24,
-                analyst_lookback_hours=720,
-                max_items_per_source=5,
-                total_items_cap=5,
-                timeout_seconds=3.0,
-                include_full_article_text=True,
-                article_text_max_chars=1200,
-                enable_sec_filings=False,
-                sec_user_agent="ai-autotrader/0.2 (test)",
-                sec_forms=["10-Q"],
-                enable_earnings_transcripts=False,
-                fmp_api_key="",
-                earnings_transcript_max_chars=2000,
-                enable_social_feeds=False,
-                social_feed_rss_urls=[],
-                trusted_social_accounts=[],
-                enable_analyst_ratings=False,
-                finnhub_api_key="",
-            )
+            items = self._collect(include_full_article_text=True)
 
         self.assertEqual(len(items), 1)
         self.assertEqual(items[0].content, "Full article body")
 
+    def test_collect_research_items_keeps_other_sources_when_one_fails(self) -> None:
+        social_item = NewsItem(
+            title="Trusted account discusses NVDA demand",
+            description="",
+            source="Trusted Feed",
+            link="https://social.example/post",
+            published_at=datetime.now(timezone.utc),
+            source_type="social",
+        )
+
+        with (
+            patch("ai_trader_bot.data.research.fetch_google_news_items", return_value=[]),
+            patch("ai_trader_bot.data.research.fetch_sec_filings_items", side_effect=RuntimeError("boom")),
+            patch("ai_trader_bot.data.research.fetch_social_feed_items", return_value=[social_item]),
+            self.assertLogs(level="WARNING") as logs,
+        ):
+            items = self._collect(enable_sec_filings=True, enable_social_feeds=True)
+
+        self.assertEqual([item.source_type for item in items], ["social"])
+        self.assertIn("SEC filings fetch failed for NVDA", logs.output[0])
+
+
+    def test_sec_ticker_map_is_fetched_once_under_concurrent_loads(self) -> None:
+        calls: list[str] = []
+
+        def slow_fetch(url: str, **_: Any) -> dict:
+            calls.append(url)
+            time.sleep(0.05)
+            return {"0": {"ticker": "nvda", "cik_str": 1045810}}
+
+        results: list[dict[str, str]] = []
+        with (
+            patch.object(research, "_SEC_TICKER_MAP", None),
+            patch("ai_trader_bot.data.research._fetch_url_json", side_effect=slow_fetch),
+        ):
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        research._load_sec_ticker_map(timeout_seconds=1.0, user_agent="test")
+                    )
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"NVDA": "0001045810"}] * 4)
 
 if __name__ == "__main__":
     import unittest
@@ -21,6 +21,8 @@ class RuntimeStateTests(unittest.TestCase):
             store.mark_research_pull(ts)
             store.mark_warmup_done_for_day(date(2026, 2, 16))
 
+            self.assertFalse((Path(tmp_dir) / "runtime_state.json.tmp").exists())
+
             reloaded = RuntimeStateStore(str(path))
             self.assertEqual(reloaded.get_last_research_pull_at(), ts)
             self.assertTrue(reloaded.is_warmup_done_for_day(date(2026, 2, 16)))